@@ -120,6 +120,7 @@ class Position:
     exit_target: int  # Measured-move exit price (computed once at entry)
     order_id: Optional[str] = None
     exit_order_id: Optional[str] = None  # Exit order placed via measured move
+    position_id: Optional[str] = None  # Supabase positions row, set when the entry is logged
 
     def time_in_position_minutes(self) -> int:
         """Calculate how long we've been in this position."""
@@ -511,17 +512,20 @@ class NHLTradingBot:
                 fav_market = self.client.get_market(game.favorite_ticker)
                 current_price = fav_market.last_price if fav_market else game.favorite_opening_price
 
-                # Log 30m checkpoint to Supabase
+                # Check if favorite still qualifies (≥59%)
+                is_eligible = game.favorite_opening_price >= 59.0
+
+                # Log 30m checkpoint and eligibility to Supabase
                 if self.logger:
-                    self.logger.update_game_checkpoint(
+                    self.logger.update_game_checkpoint_and_eligibility(
                         market_ticker=game.favorite_ticker,
                         field_name='odds_30m',
                         odds=current_price / 100,
-                        timestamp=int(time.time())
+                        timestamp=int(time.time()),
+                        is_eligible=is_eligible
                     )
 
-                # Check if favorite still qualifies (≥59%)
-                if game.favorite_opening_price >= 59.0:
+                if is_eligible:
                     # TODO: Add volume check here when API access is available
                     # For now, assume qualified if ≥59%
                     game.is_qualified = True
@@ -530,26 +534,12 @@ class NHLTradingBot:
                     logger.info(f"  ✅ QUALIFIED: Favorite {game.favorite_team} @ {game.favorite_opening_price}%")
                     logger.info(f"  📊 Placing limit orders for in-game dips <45¢")
 
-                    # Update eligibility in Supabase
-                    if self.logger:
-                        self.logger.update_game_eligibility(
-                            market_ticker=game.favorite_ticker,
-                            is_eligible=True
-                        )
-
                     # Place tiered limit orders at different price levels
                     self.place_tiered_limit_orders(game)
                 else:
                     logger.info(f"\n[{checkpoint.upper()}] {game.away_team} @ {game.home_team}")
                     logger.info(f"  ❌ NOT QUALIFIED: Favorite only {game.favorite_opening_price}% (need ≥59%)")
 
-                    # Update eligibility in Supabase
-                    if self.logger:
-                        self.logger.update_game_eligibility(
-                            market_ticker=game.favorite_ticker,
-                            is_eligible=False
-                        )
-
     def place_tiered_limit_orders(self, game: NHLGame):
         """
         Place tiered limit orders at 30-minute checkpoint.
@@ -716,9 +706,9 @@ class NHLTradingBot:
                 order_status = self.trading_client.get_order_status(position.order_id)
 
                 # Handle "executed but filled_count=0" (Kalshi quirk)
-                order = (order_status or {}).get('order', {})
-                status = order.get('status', 'pending')
-                filled_count = order.get('filled_count', 0)
+                status = order_status.status if order_status else 'pending'
+                filled_count = order_status.filled_count if order_status else 0
+                order_count = (order_status.count or 0) if order_status else 0
 
                 # Special handling for "executed" status with 0 filled_count
                 if status == 'executed' and filled_count == 0:
@@ -784,7 +774,7 @@ class NHLTradingBot:
                                     'order_id': position.order_id,
                                     'status': 'open'
                                 }
-                                self.logger.log_position_entry(position_data)
+                                position.position_id = self.logger.log_position_entry(position_data)
 
                                 # Log bankroll change
                                 cost = (position.entry_price / 100) * count
@@ -814,9 +804,9 @@ class NHLTradingBot:
                         else:
                             logger.warning(f"   ⚠️  Game not found for position {position.ticker} - cannot place exit order")
 
-                elif status == 'pending' and filled_count > 0 and filled_count < order.get('count', 0):
+                elif status == 'pending' and filled_count > 0 and filled_count < order_count:
                     # Partial fill
-                    logger.info(f"📊 Partial fill: {position.order_id} - {filled_count}/{order.get('count')} filled")
+                    logger.info(f"📊 Partial fill: {position.order_id} - {filled_count}/{order_count} filled")
                     if self.logger:
                         try:
                             self.logger.update_order_status(
@@ -845,8 +835,7 @@ class NHLTradingBot:
             try:
                 # Check exit order status with Kalshi
                 order_status = self.trading_client.get_order_status(position.exit_order_id)
-                order = (order_status or {}).get('order', {})
-                status = order.get('status', 'pending')
+                status = order_status.status if order_status else 'pending'
 
                 # If order returns None (404) or status is filled/executed
                 if order_status is None or status in ('filled', 'executed'):
@@ -877,13 +866,14 @@ class NHLTradingBot:
                                     filled_size=total_filled
                                 )
 
-                                # Log position exit
-                                self.logger.log_position_exit(
-                                    market_ticker=position.ticker,
-                                    exit_price=int(avg_exit_price),
-                                    exit_time=int(time.time()),
-                                    pnl=pnl
-                                )
+                                # Log position exit (no row to update if the entry never got logged)
+                                if position.position_id:
+                                    self.logger.log_position_exit(
+                                        position_id=position.position_id,
+                                        exit_price=int(avg_exit_price),
+                                        exit_time=int(time.time()),
+                                        pnl=pnl
+                                    )
 
                                 # Log bankroll change
                                 proceeds = (avg_exit_price / 100) * total_filled
@@ -907,11 +897,12 @@ class NHLTradingBot:
 
                 elif status == 'pending':
                     # Still waiting
-                    filled_count = order.get('filled_count', 0)
+                    filled_count = order_status.filled_count
+                    order_count = order_status.count or 0
 
                     # Check for partial fills on exit
-                    if filled_count > 0 and filled_count < order.get('count', 0):
-                        logger.info(f"📊 Partial exit: {position.exit_order_id} - {filled_count}/{order.get('count')} filled")
+                    if filled_count > 0 and filled_count < order_count:
+                        logger.info(f"📊 Partial exit: {position.exit_order_id} - {filled_count}/{order_count} filled")
                         if self.logger:
                             try:
                                 self.logger.update_order_status(
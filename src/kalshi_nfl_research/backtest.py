@@ -378,7 +378,13 @@ def compute_summary(
             band_metrics=[],
         )
 
-    df = pd.DataFrame([t.model_dump() for t in trades])
+    # Column-wise, and only the fields the summary reads
+    df = pd.DataFrame({
+        "pnl_gross_cents": np.array([t.pnl_gross_cents for t in trades], dtype=np.int64),
+        "pnl_net_cents": np.array([t.pnl_net_cents for t in trades], dtype=np.int64),
+        "hold_time_sec": np.array([t.hold_time_sec for t in trades], dtype=np.int64),
+        "band_hit": np.array([t.band_hit for t in trades], dtype=np.float64),
+    })
 
     total_pnl_gross = df["pnl_gross_cents"].sum()
     total_pnl_net = df["pnl_net_cents"].sum()
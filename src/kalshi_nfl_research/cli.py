@@ -13,10 +13,11 @@ from pathlib import Path
 from typing import Optional
 
 import click
+import msgspec
 import yaml
 
 from .backtest import run_backtest
-from .data_models import BacktestConfig
+from .data_models import BacktestConfig, Candle, Trade
 from .discovery import discover_games_with_markets, discover_nfl_series
 from .fetch import fetch_game_data
 from .io_utils import (
@@ -26,6 +27,7 @@ from .io_utils import (
     save_parquet,
     save_summary_markdown,
     save_trades_csv,
+    trades_to_table,
 )
 from .kalshi_client import KalshiClient
 from .plots import generate_all_plots
@@ -195,19 +197,23 @@ def pull_game(event: str, series: Optional[str], out: str, config: str):
 
         # Save candles
         if game_data.candles:
-            candles_df = pd.DataFrame([c.model_dump() for c in game_data.candles])
+            candles_df = pd.DataFrame(
+                {name: [getattr(c, name) for c in game_data.candles] for name in Candle.model_fields}
+            )
             candles_df.to_csv(output_dir / "candles.csv", index=False)
             logger.info(f"Saved {len(candles_df)} candles")
 
         # Save trades
         if game_data.trades:
-            trades_df = pd.DataFrame([t.model_dump() for t in game_data.trades])
+            trades_df = pd.DataFrame(
+                {name: [getattr(t, name) for t in game_data.trades] for name in Trade.model_fields}
+            )
             trades_df.to_csv(output_dir / "trades.csv", index=False)
             logger.info(f"Saved {len(trades_df)} trades")
 
         # Save orderbook snapshot
         if game_data.orderbook:
-            ob_df = pd.DataFrame([game_data.orderbook.model_dump()])
+            ob_df = pd.DataFrame([msgspec.structs.asdict(game_data.orderbook)])
             ob_df.to_csv(output_dir / "orderbook.csv", index=False)
             logger.info(f"Saved orderbook snapshot")
 
@@ -285,8 +291,12 @@ def backtest(
 
     logger.info(f"Config: {backtest_config.model_dump()}")
 
-    # Initialize client
-    client = KalshiClient(base_url=kalshi_base, rate_limit_sleep_ms=rate_limit_ms)
+    # Initialize client (only closed historical windows are cached on disk)
+    client = KalshiClient(
+        base_url=kalshi_base,
+        rate_limit_sleep_ms=rate_limit_ms,
+        cache_dir=cfg.get("cache_dir", "./.cache/kalshi"),
+    )
 
     try:
         # Discover games
@@ -330,10 +340,11 @@ def backtest(
 
         # Save results
         logger.info("Saving results...")
-        save_trades_csv(trades, output_dir)
-        save_by_event_csv(trades, output_dir)
+        trades_table = trades_to_table(trades)
+        save_trades_csv(trades_table, output_dir)
+        save_by_event_csv(trades_table, output_dir)
         save_band_metrics_csv(summary, output_dir)
-        save_parquet(trades, output_dir)
+        save_parquet(trades_table, output_dir)
 
         # Build command line string for summary
         command_line = f"python -m kalshi_nfl_research backtest --from {start_date} --to {end_date}"
@@ -1,11 +1,16 @@
 """
 Pydantic data models for Kalshi API responses and backtest outputs.
 
+Also defines msgspec wire structs used to decode high-volume trade and
+candlestick pages straight from response bytes.
+
 All timestamps are Unix seconds (UTC). Prices are in cents unless noted.
 """
 
-from typing import Any, Literal, Optional
+from typing import Any, Literal, Optional, Union
 from datetime import datetime
+
+import msgspec
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -157,8 +162,80 @@ class Candle(BaseModel):
         frozen = True
 
 
-class OrderbookSnapshot(BaseModel):
-    """Represents orderbook depth at a point in time."""
+# -----------------------------------------------------------------------------
+# Wire structs (msgspec) for hot-path decoding
+# -----------------------------------------------------------------------------
+
+
+class TradeMS(msgspec.Struct, frozen=True, gc=False):
+    """Trade as returned by /markets/trades, decoded without an intermediate dict."""
+
+    ticker: str
+    created_time: Union[int, datetime]  # API sends ISO 8601
+    yes_price: int
+    count: int = 1
+    trade_id: Optional[str] = None
+    no_price: Optional[int] = None
+    taker_side: Optional[Literal["yes", "no"]] = None
+
+    def to_trade(self) -> Trade:
+        """Convert to a Trade model (fields already type-checked by msgspec)."""
+        created_time = self.created_time
+        if isinstance(created_time, datetime):
+            created_time = int(created_time.timestamp())
+        return Trade.model_construct(
+            trade_id=self.trade_id,
+            ticker=self.ticker,
+            created_time=created_time,
+            count=self.count,
+            yes_price=self.yes_price,
+            no_price=self.no_price,
+            taker_side=self.taker_side,
+        )
+
+
+class TradesPage(msgspec.Struct):
+    """One page of /markets/trades."""
+
+    trades: list[TradeMS] = []
+    cursor: Optional[str] = None
+
+
+class CandleMS(msgspec.Struct, frozen=True, gc=False):
+    """Candlestick as returned by the candlesticks endpoint."""
+
+    start_period_ts: int
+    open: int
+    high: int
+    low: int
+    close: int
+    volume: int = 0
+
+    def to_candle(self) -> Candle:
+        """Convert to a Candle model (fields already type-checked by msgspec)."""
+        return Candle.model_construct(
+            start_ts=self.start_period_ts,
+            open_cents=self.open,
+            high_cents=self.high,
+            low_cents=self.low,
+            close_cents=self.close,
+            volume=self.volume,
+        )
+
+
+class CandlesPage(msgspec.Struct):
+    """Candlesticks response body."""
+
+    candles: list[CandleMS] = []
+
+
+class OrderbookSnapshot(msgspec.Struct, frozen=True):
+    """
+    Represents orderbook depth at a point in time.
+
+    A msgspec struct rather than a pydantic model: snapshots are built on every
+    poll from already-typed values, so construction skips validation.
+    """
 
     ticker: str
     ts: int  # Unix timestamp when snapshot was taken
@@ -167,9 +244,6 @@ class OrderbookSnapshot(BaseModel):
     yes_bid_size: Optional[int] = None
     yes_ask_size: Optional[int] = None
 
-    class Config:
-        frozen = True
-
 
 class EntryExit(BaseModel):
     """Represents a single simulated trade (entry + exit)."""
@@ -3,16 +3,75 @@ I/O utilities for saving backtest results to CSV, Parquet, and markdown.
 """
 
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 
 from .data_models import BacktestSummary, EntryExit
 
 logger = logging.getLogger(__name__)
 
+# Column layout of EntryExit, used to build trade tables without pandas
+_TRADE_SCHEMA = pa.schema([
+    ("event_ticker", pa.string()),
+    ("favorite_side", pa.string()),
+    ("pregame_prob", pa.float64()),
+    ("kickoff_ts", pa.int64()),
+    ("halftime_ts", pa.int64()),
+    ("trigger_ts", pa.int64()),
+    ("trigger_prob", pa.float64()),
+    ("entry_ts", pa.int64()),
+    ("entry_prob", pa.float64()),
+    ("entry_price_cents", pa.int64()),
+    ("entry_fill_source", pa.string()),
+    ("exit_ts", pa.int64()),
+    ("exit_prob", pa.float64()),
+    ("exit_price_cents", pa.int64()),
+    ("exit_fill_source", pa.string()),
+    ("exit_reason", pa.string()),
+    ("band_hit", pa.float64()),
+    ("pnl_gross_cents", pa.int64()),
+    ("pnl_net_cents", pa.int64()),
+    ("fees_paid_cents", pa.int64()),
+    ("slippage_cents", pa.int64()),
+    ("mae", pa.float64()),
+    ("mfe", pa.float64()),
+    ("max_drawdown_cents", pa.int64()),
+    ("hold_time_sec", pa.int64()),
+])
+
+_TS_COLUMNS = ["kickoff_ts", "halftime_ts", "trigger_ts", "entry_ts", "exit_ts"]
+
+# Probability-valued float columns; byte-stream-split compresses them far
+# better than plain encoding
+_SPLIT_FLOAT_COLUMNS = ["entry_prob", "exit_prob", "mae", "mfe"]
+
+_PARQUET_ROW_GROUP_SIZE = 128_000
+
+
+def trades_to_table(trades: list[EntryExit]) -> pa.Table:
+    """
+    Convert trades to a columnar Arrow table.
+
+    Build this once per run and pass it to every trade-level writer.
+
+    Args:
+        trades: List of EntryExit records.
+
+    Returns:
+        Table with one column per EntryExit field, typed by _TRADE_SCHEMA.
+    """
+    cols = {name: [getattr(t, name) for t in trades] for name in _TRADE_SCHEMA.names}
+    return pa.Table.from_pydict(cols, schema=_TRADE_SCHEMA)
+
 
 def create_output_dir(base_dir: str = "./artifacts") -> Path:
     """
@@ -31,27 +90,26 @@ def create_output_dir(base_dir: str = "./artifacts") -> Path:
     return output_dir
 
 
-def save_trades_csv(trades: list[EntryExit], output_dir: Path) -> Path:
+def save_trades_csv(table: pa.Table, output_dir: Path) -> Path:
     """
     Save trade-level results to CSV.
 
     Args:
-        trades: List of EntryExit records.
+        table: Trades table from trades_to_table().
         output_dir: Output directory.
 
     Returns:
         Path to saved CSV file.
     """
-    if not trades:
+    if table.num_rows == 0:
         logger.warning("No trades to save")
         return output_dir / "trades.csv"
 
-    df = pd.DataFrame([t.model_dump() for t in trades])
-
     # Convert timestamps to human-readable
-    for col in ["kickoff_ts", "halftime_ts", "trigger_ts", "entry_ts", "exit_ts"]:
-        if col in df.columns:
-            df[f"{col}_utc"] = pd.to_datetime(df[col], unit="s", utc=True)
+    for col in _TS_COLUMNS:
+        table = table.append_column(
+            f"{col}_utc", pc.cast(table[col], pa.timestamp("s", "UTC"))
+        )
 
     # Reorder columns for readability
     priority_cols = [
@@ -70,53 +128,61 @@ def save_trades_csv(trades: list[EntryExit], output_dir: Path) -> Path:
         "mae",
         "mfe",
     ]
-    remaining_cols = [c for c in df.columns if c not in priority_cols]
-    ordered_cols = [c for c in priority_cols if c in df.columns] + remaining_cols
-    df = df[ordered_cols]
+    remaining_cols = [c for c in table.column_names if c not in priority_cols]
+    table = table.select(priority_cols + remaining_cols)
 
     output_path = output_dir / "trades.csv"
-    df.to_csv(output_path, index=False)
-    logger.info(f"Saved {len(df)} trades to {output_path}")
+    pa_csv.write_csv(
+        table,
+        str(output_path),
+        write_options=pa_csv.WriteOptions(
+            include_header=True, batch_size=1 << 16, quoting_style="needed"
+        ),
+    )
+    logger.info(f"Saved {table.num_rows} trades to {output_path}")
 
     return output_path
 
 
-def save_by_event_csv(trades: list[EntryExit], output_dir: Path) -> Path:
+def save_by_event_csv(table: pa.Table, output_dir: Path) -> Path:
     """
     Save event-level aggregates to CSV.
 
     Args:
-        trades: List of EntryExit records.
+        table: Trades table from trades_to_table().
         output_dir: Output directory.
 
     Returns:
         Path to saved CSV file.
     """
-    if not trades:
+    if table.num_rows == 0:
         logger.warning("No trades to aggregate by event")
         return output_dir / "by_event.csv"
 
-    df = pd.DataFrame([t.model_dump() for t in trades])
-
-    # Aggregate by event
-    event_agg = df.groupby("event_ticker").agg(
-        {
-            "pregame_prob": "first",
-            "kickoff_ts": "first",
-            "entry_ts": "first",
-            "exit_ts": "first",
-            "pnl_gross_cents": "sum",
-            "pnl_net_cents": "sum",
-            "hold_time_sec": "mean",
-            "mae": "max",
-            "mfe": "max",
-        }
-    ).reset_index()
-
-    event_agg["kickoff_utc"] = pd.to_datetime(event_agg["kickoff_ts"], unit="s", utc=True)
+    # Aggregate by event; single-threaded so "first" follows row order
+    aggregations = [
+        ("pregame_prob", "first"),
+        ("kickoff_ts", "first"),
+        ("entry_ts", "first"),
+        ("exit_ts", "first"),
+        ("pnl_gross_cents", "sum"),
+        ("pnl_net_cents", "sum"),
+        ("hold_time_sec", "mean"),
+        ("mae", "max"),
+        ("mfe", "max"),
+    ]
+    event_agg = table.group_by("event_ticker", use_threads=False).aggregate(aggregations)
+    event_agg = event_agg.select(
+        ["event_ticker"] + [f"{col}_{fn}" for col, fn in aggregations]
+    ).rename_columns(["event_ticker"] + [col for col, _ in aggregations])
+    event_agg = event_agg.sort_by("event_ticker")
+
+    event_agg = event_agg.append_column(
+        "kickoff_utc", pc.cast(event_agg["kickoff_ts"], pa.timestamp("s", "UTC"))
+    )
 
     output_path = output_dir / "by_event.csv"
-    event_agg.to_csv(output_path, index=False)
+    pa_csv.write_csv(event_agg, str(output_path))
     logger.info(f"Saved event aggregates to {output_path}")
 
     return output_path
@@ -258,32 +324,50 @@ def save_summary_markdown(
     ])
 
     output_path = output_dir / "summary.md"
-    with open(output_path, "w") as f:
-        f.write("\n".join(md_lines))
+    payload = memoryview("\n".join(md_lines).encode("utf-8"))
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Single write in practice; loop only guards against short writes
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
 
     logger.info(f"Saved summary markdown to {output_path}")
     return output_path
 
 
-def save_parquet(trades: list[EntryExit], output_dir: Path) -> Path:
+def save_parquet(table: pa.Table, output_dir: Path) -> Path:
     """
     Save trades to Parquet format for efficient storage.
 
     Args:
-        trades: List of trades.
+        table: Trades table from trades_to_table().
         output_dir: Output directory.
 
     Returns:
         Path to saved Parquet file.
     """
-    if not trades:
+    if table.num_rows == 0:
         logger.warning("No trades to save to Parquet")
         return output_dir / "trades.parquet"
 
-    df = pd.DataFrame([t.model_dump() for t in trades])
+    # Sort by entry time so row-group statistics on entry_ts are selective
+    order = np.argsort(table["entry_ts"].to_numpy(), kind="stable")
+    table = table.take(order)
 
     output_path = output_dir / "trades.parquet"
-    df.to_parquet(output_path, index=False)
-    logger.info(f"Saved {len(df)} trades to {output_path}")
+    string_cols = [f.name for f in _TRADE_SCHEMA if pa.types.is_string(f.type)]
+    with pq.ParquetWriter(
+        output_path,
+        schema=_TRADE_SCHEMA,
+        compression="zstd",
+        write_statistics=True,
+        use_dictionary=string_cols,
+        column_encoding={col: "BYTE_STREAM_SPLIT" for col in _SPLIT_FLOAT_COLUMNS},
+        sorting_columns=[pq.SortingColumn(_TRADE_SCHEMA.get_field_index("entry_ts"))],
+    ) as writer:
+        writer.write_table(table, row_group_size=_PARQUET_ROW_GROUP_SIZE)
+    logger.info(f"Saved {table.num_rows} trades to {output_path}")
 
     return output_path
@@ -5,16 +5,102 @@ All endpoints are public and require no authentication.
 """
 
 import logging
+import math
+import operator
 import os
+import threading
 import time
-from typing import Any, Iterator, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Optional, Union
+
+import httpx
+import msgspec
+import numpy as np
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .data_models import (
+    Candle,
+    CandlesPage,
+    MarketInfo,
+    OrderbookSnapshot,
+    SeriesInfo,
+    Trade,
+    TradeMS,
+    TradesPage,
+)
+from .response_cache import ResponseCache
 
-import requests
+logger = logging.getLogger(__name__)
 
-from .data_models import Candle, MarketInfo, OrderbookSnapshot, SeriesInfo, Trade
+# Receive buffers above this size are dropped after use rather than kept
+_RECV_BUF_MAX = 1 << 20
 
-logger = logging.getLogger(__name__)
+# Bulk validators: one schema lookup and a single core pass per list
+_SERIES_LIST = TypeAdapter(list[SeriesInfo])
+_MARKET_LIST = TypeAdapter(list[MarketInfo])
+
+# Typed page decoders: JSON bytes straight into structs, no intermediate dicts
+_TRADES_PAGE = msgspec.json.Decoder(TradesPage)
+_CANDLES_PAGE = msgspec.json.Decoder(CandlesPage)
+
+
+def _validate_items(
+    adapter: TypeAdapter,
+    model: type[BaseModel],
+    items: list[dict[str, Any]],
+    kind: str,
+    key: Optional[str] = None,
+) -> list[Any]:
+    """
+    Validate raw API items in bulk, falling back to per-item parsing.
+
+    The per-item path only runs when batch validation fails, so a single
+    malformed row is skipped instead of discarding the whole pull.
+
+    Args:
+        adapter: TypeAdapter for a list of `model`.
+        model: Model class used for the per-item fallback.
+        items: Raw item dictionaries.
+        kind: Item description for log messages.
+        key: Item field identifying the row in log messages.
+
+    Returns:
+        List of validated model instances.
+    """
+    try:
+        return adapter.validate_python(items)
+    except ValidationError:
+        pass
+
+    parsed = []
+    for item in items:
+        try:
+            parsed.append(model(**item))
+        except Exception as e:
+            label = f" {item.get(key)}" if key else ""
+            logger.warning(f"Failed to parse {kind}{label}: {e}")
+    return parsed
+
+
+def _sort_by_ts(items: list[Any], attr: str) -> list[Any]:
+    """
+    Stable-sort items by an integer timestamp attribute.
+
+    Timestamps are pulled into one contiguous int64 array and sorted in C;
+    only the final gather runs in Python.
+    """
+    get_ts = operator.attrgetter(attr)
+    ts = np.fromiter(map(get_ts, items), dtype=np.int64, count=len(items))
+    order = np.argsort(ts, kind="stable")
+    return [items[i] for i in order.tolist()]
+
+
+def _historical_ttl(end_ts: Optional[int]) -> Optional[float]:
+    """Cache windows that closed in the past forever; they are immutable."""
+    if end_ts and end_ts < time.time():
+        return math.inf
+    return None
 
 
 class KalshiClient:
@@ -23,104 +109,256 @@ class KalshiClient:
 
     Features:
     - Configurable base URL via environment variable or constructor
-    - Automatic pagination with cursor
-    - Polite rate limiting
+    - Automatic pagination with cursor (next page prefetched in background)
+    - Polite rate limiting (monotonic deadline, thread-safe)
+    - Optional disk cache of GET responses for repeat historical pulls
     - Typed response models
+    - One pooled HTTP connection set per base URL, shared by all instances
     """
 
+    # base_url -> [httpx.Client, number of open KalshiClients using it]
+    _shared_sessions: dict[str, list] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def _acquire_session(cls, base_url: str) -> httpx.Client:
+        """Return the process-wide session for base_url, creating it if needed."""
+        with cls._shared_lock:
+            entry = cls._shared_sessions.get(base_url)
+            if entry is None:
+                # HTTP/2 multiplexes paginated requests over one connection;
+                # httpx transparently decompresses gzip/brotli bodies
+                session = httpx.Client(
+                    http2=True,
+                    headers={"Accept": "application/json", "Accept-Encoding": "gzip, br"},
+                    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                )
+                entry = cls._shared_sessions[base_url] = [session, 0]
+            entry[1] += 1
+            return entry[0]
+
+    @classmethod
+    def _release_session(cls, base_url: str) -> None:
+        """Drop one reference to the shared session; close it on the last one."""
+        with cls._shared_lock:
+            entry = cls._shared_sessions[base_url]
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del cls._shared_sessions[base_url]
+        entry[0].close()
+
     def __init__(
         self,
         base_url: Optional[str] = None,
         rate_limit_sleep_ms: int = 200,
         timeout: int = 30,
+        max_workers: int = 4,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 0,
     ):
         """
         Initialize Kalshi API client.
 
         Args:
             base_url: API base URL. Defaults to KALSHI_BASE env var or fallback.
-            rate_limit_sleep_ms: Milliseconds to sleep between requests.
+            rate_limit_sleep_ms: Minimum milliseconds between requests.
             timeout: Request timeout in seconds.
+            max_workers: Threads available for prefetching paginated results.
+            cache_dir: Directory for the response cache. Disabled if None.
+            cache_ttl: Default cache entry lifetime in seconds. 0 (the default)
+                caches only requests that pass their own cache_ttl, i.e. the
+                closed historical windows marked by _historical_ttl.
         """
         self.base_url = (
             base_url
             or os.getenv("KALSHI_BASE", "https://api.elections.kalshi.com/trade-api/v2")
         ).rstrip("/")
+        self._url_prefix = self.base_url + "/"
         self.rate_limit_sleep_ms = rate_limit_sleep_ms
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({"Accept": "application/json"})
+        # Shared across instances; timeout is applied per request instead
+        self.session = self._acquire_session(self.base_url)
+        self._closed = False
+        self._gap = rate_limit_sleep_ms / 1000.0
+        self._next_allowed = 0.0
+        self._rate_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kalshi-prefetch"
+        )
+        self._loads = orjson.loads
+        self._cache = ResponseCache(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        # Per-thread receive buffer reused across requests (see _recv_buffer)
+        self._local = threading.local()
         logger.info(f"Initialized KalshiClient with base_url={self.base_url}")
 
-    def _get(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    def _wait_for_slot(self) -> None:
+        """
+        Enforce the minimum gap between request starts.
+
+        Sleeps only for whatever remains of the gap since the previous slot,
+        so a request that already took longer than the gap pays nothing.
+        Slots are reserved under a lock so prefetch threads stay spaced out.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + self._gap
+
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def _recv_buffer(self) -> bytearray:
+        """Return this thread's reusable response body buffer."""
+        buf = getattr(self._local, "recv_buf", None)
+        if buf is None:
+            buf = self._local.recv_buf = bytearray()
+        return buf
+
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+        decoder: Optional[msgspec.json.Decoder] = None,
+    ) -> Any:
         """
         Execute GET request with rate limiting and error handling.
 
+        Cache hits are served from disk without consuming a rate-limit token.
+
         Args:
             endpoint: API endpoint path (e.g., "/series").
             params: Query parameters.
+            cache_ttl: Cache lifetime override in seconds (0 bypasses the
+                cache, math.inf never expires). Defaults to client cache_ttl.
+            decoder: Optional msgspec decoder for a typed response body.
 
         Returns:
-            JSON response as dict.
+            Decoded struct if `decoder` is given and the body matches its
+            schema, otherwise the JSON response as dict.
 
         Raises:
-            requests.HTTPError: On HTTP error status.
+            httpx.HTTPStatusError: On HTTP error status.
         """
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        url = self._url_prefix + (endpoint[1:] if endpoint.startswith("/") else endpoint)
         logger.debug(f"GET {url} with params={params}")
 
-        time.sleep(self.rate_limit_sleep_ms / 1000.0)
+        ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+        use_cache = self._cache is not None and ttl > 0
+        if use_cache:
+            body = self._cache.get(url, params, ttl)
+            if body is not None:
+                logger.debug(f"Cache hit for {url}")
+                return self._decode(url, body, decoder)
+
+        self._wait_for_slot()
 
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            # Stream the body into the reusable buffer; writing in place over
+            # the previous contents avoids reallocating per request
+            buf = self._recv_buffer()
+            size = 0
+            with self.session.stream(
+                "GET", url, params=params, timeout=self.timeout
+            ) as response:
+                if response.is_error:
+                    response.read()
+                response.raise_for_status()
+                for chunk in response.iter_bytes(65536):
+                    buf[size:size + len(chunk)] = chunk
+                    size += len(chunk)
+
+            body = memoryview(buf)[:size]
+            try:
+                if use_cache:
+                    self._cache.put(url, params, bytes(body))
+                return self._decode(url, body, decoder)
+            finally:
+                body.release()
+                if len(buf) > _RECV_BUF_MAX:
+                    self._local.recv_buf = bytearray()
+        except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error {e.response.status_code} for {url}: {e.response.text}")
             raise
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request failed for {url}: {e}")
             raise
 
+    def _decode(
+        self, url: str, body: Union[bytes, memoryview], decoder: Optional[msgspec.json.Decoder]
+    ) -> Any:
+        """
+        Decode a response body, preferring the typed decoder when given.
+
+        A body that fails typed validation (e.g. one malformed row) falls back
+        to plain dict parsing so callers can skip bad items individually.
+        """
+        if decoder is not None:
+            try:
+                return decoder.decode(body)
+            except msgspec.ValidationError as e:
+                logger.warning(f"Typed decode failed for {url} ({e}); falling back to dicts")
+        # orjson parses the raw body bytes directly (no str decode step)
+        return self._loads(body)
+
     def _paginate(
-        self, endpoint: str, params: Optional[dict[str, Any]] = None, data_key: str = "series"
-    ) -> Iterator[dict[str, Any]]:
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        data_key: str = "series",
+        cache_ttl: Optional[float] = None,
+        decoder: Optional[msgspec.json.Decoder] = None,
+    ) -> Iterator[Any]:
         """
         Paginate through API results using cursor.
 
+        As soon as a page's cursor is known, the next page is requested on the
+        prefetch pool so network latency overlaps with the caller consuming
+        the current page's items.
+
         Args:
             endpoint: API endpoint.
             params: Base query parameters.
             data_key: Key in response containing the data list.
+            cache_ttl: Cache lifetime override passed through to `_get`.
+            decoder: Optional msgspec page decoder passed through to `_get`.
 
         Yields:
-            Individual items from paginated results.
+            Individual items from paginated results (structs for pages that
+            decoded with `decoder`, raw dicts otherwise).
         """
-        params = params or {}
-        cursor = None
+        params = dict(params or {})
+        pending = self._executor.submit(self._get, endpoint, params, cache_ttl, decoder)
 
         while True:
-            if cursor:
-                params["cursor"] = cursor
-
-            response = self._get(endpoint, params)
-            items = response.get(data_key, [])
+            response = pending.result()
+            if isinstance(response, dict):
+                items = response.get(data_key, [])
+                cursor = response.get("cursor")
+            else:
+                items = getattr(response, data_key)
+                cursor = response.cursor
 
             if not items:
                 logger.debug(f"No more items for {endpoint}")
                 break
 
-            for item in items:
-                yield item
+            # Start fetching the next page before yielding this one
+            if cursor:
+                pending = self._executor.submit(
+                    self._get, endpoint, {**params, "cursor": cursor}, cache_ttl, decoder
+                )
+                logger.debug(f"Fetched {len(items)} items, next cursor={cursor[:20]}...")
+
+            yield from items
 
-            # Check for next cursor
-            cursor = response.get("cursor")
             if not cursor:
                 logger.debug(f"No cursor found, pagination complete for {endpoint}")
                 break
 
-            logger.debug(f"Fetched {len(items)} items, next cursor={cursor[:20]}...")
-
     # -------------------------------------------------------------------------
     # Series Endpoints
     # -------------------------------------------------------------------------
@@ -137,13 +375,8 @@ class KalshiClient:
             List of SeriesInfo objects.
         """
         params = {"limit": limit, "with_nested_markets": str(with_nested_markets).lower()}
-        series_list = []
-
-        for item in self._paginate("/series", params=params, data_key="series"):
-            try:
-                series_list.append(SeriesInfo(**item))
-            except Exception as e:
-                logger.warning(f"Failed to parse series {item.get('series_ticker')}: {e}")
+        items = list(self._paginate("/series", params=params, data_key="series"))
+        series_list = _validate_items(_SERIES_LIST, SeriesInfo, items, "series", "ticker")
 
         logger.info(f"Fetched {len(series_list)} series")
         return series_list
@@ -205,12 +438,8 @@ class KalshiClient:
         if series_ticker:
             params["series_ticker"] = series_ticker
 
-        markets = []
-        for item in self._paginate("/markets", params=params, data_key="markets"):
-            try:
-                markets.append(MarketInfo(**item))
-            except Exception as e:
-                logger.warning(f"Failed to parse market {item.get('ticker')}: {e}")
+        items = list(self._paginate("/markets", params=params, data_key="markets"))
+        markets = _validate_items(_MARKET_LIST, MarketInfo, items, "market", "ticker")
 
         logger.info(
             f"Fetched {len(markets)} markets for event_ticker={event_ticker}, series_ticker={series_ticker}"
@@ -247,28 +476,21 @@ class KalshiClient:
             OrderbookSnapshot or None.
         """
         try:
-            response = self._get(f"/markets/{ticker}/orderbook")
+            # Live data: never served from cache
+            response = self._get(f"/markets/{ticker}/orderbook", cache_ttl=0)
             orderbook = response.get("orderbook", {})
 
-            # Parse yes side
-            yes_bids = orderbook.get("yes", [])
-            yes_asks = orderbook.get("no", [])  # No side acts as yes asks
-
-            # Handle list format [price_cents, count]
-            best_yes_bid = yes_bids[0] if yes_bids else None
-            best_yes_ask = yes_asks[0] if yes_asks else None
-
-            # Extract price and count from list format
-            yes_bid_price = best_yes_bid[0] if best_yes_bid else None
-            yes_ask_price = best_yes_ask[0] if best_yes_ask else None
-            yes_bid_count = best_yes_bid[1] if best_yes_bid else None
-            yes_ask_count = best_yes_ask[1] if best_yes_ask else None
+            # Best level of each side as [price_cents, count]; no side acts as yes asks
+            yes_bids = orderbook.get("yes") or ()
+            yes_asks = orderbook.get("no") or ()
+            yes_bid, yes_bid_count = yes_bids[0] if yes_bids else (None, None)
+            no_bid, yes_ask_count = yes_asks[0] if yes_asks else (None, None)
 
             return OrderbookSnapshot(
                 ticker=ticker,
                 ts=int(time.time()),
-                yes_bid=yes_bid_price,
-                yes_ask=100 - yes_ask_price if yes_ask_price else None,
+                yes_bid=yes_bid,
+                yes_ask=None if no_bid is None else 100 - no_bid,
                 yes_bid_size=yes_bid_count,
                 yes_ask_size=yes_ask_count,
             )
@@ -308,14 +530,23 @@ class KalshiClient:
             params["max_ts"] = max_ts
 
         trades = []
-        for item in self._paginate("/markets/trades", params=params, data_key="trades"):
+        for item in self._paginate(
+            "/markets/trades",
+            params=params,
+            data_key="trades",
+            cache_ttl=_historical_ttl(max_ts),
+            decoder=_TRADES_PAGE,
+        ):
+            if isinstance(item, TradeMS):
+                trades.append(item.to_trade())
+                continue
             try:
                 trades.append(Trade(**item))
             except Exception as e:
                 logger.warning(f"Failed to parse trade: {e}")
 
         # Sort by timestamp for deterministic ordering
-        trades.sort(key=lambda t: t.created_time)
+        trades = _sort_by_ts(trades, "created_time")
 
         logger.info(
             f"Fetched {len(trades)} trades for ticker={ticker}, min_ts={min_ts}, max_ts={max_ts}"
@@ -355,26 +586,33 @@ class KalshiClient:
             params["end_ts"] = end_ts
 
         try:
-            response = self._get(endpoint, params=params)
-            candles_data = response.get("candles", [])
-
-            candles = []
-            for item in candles_data:
-                try:
-                    # Map API response to our model
-                    candle = Candle(
-                        start_ts=item["start_period_ts"],
-                        open_cents=item["open"],
-                        high_cents=item["high"],
-                        low_cents=item["low"],
-                        close_cents=item["close"],
-                        volume=item.get("volume", 0),
-                    )
-                    candles.append(candle)
-                except Exception as e:
-                    logger.warning(f"Failed to parse candle: {e}")
-
-            candles.sort(key=lambda c: c.start_ts)
+            response = self._get(
+                endpoint,
+                params=params,
+                cache_ttl=_historical_ttl(end_ts),
+                decoder=_CANDLES_PAGE,
+            )
+
+            if isinstance(response, CandlesPage):
+                candles = [item.to_candle() for item in response.candles]
+            else:
+                candles = []
+                for item in response.get("candles", []):
+                    try:
+                        # Map API response to our model
+                        candle = Candle(
+                            start_ts=item["start_period_ts"],
+                            open_cents=item["open"],
+                            high_cents=item["high"],
+                            low_cents=item["low"],
+                            close_cents=item["close"],
+                            volume=item.get("volume", 0),
+                        )
+                        candles.append(candle)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse candle: {e}")
+
+            candles = _sort_by_ts(candles, "start_ts")
             logger.info(
                 f"Fetched {len(candles)} candles for {series_ticker}/{event_ticker}, interval={interval}"
             )
@@ -387,6 +625,14 @@ class KalshiClient:
             return []
 
     def close(self) -> None:
-        """Close the underlying session."""
-        self.session.close()
-        logger.debug("KalshiClient session closed")
+        """
+        Shut down the prefetch pool and release the shared session.
+
+        The session itself is closed only when the last client using it closes.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._release_session(self.base_url)
+        logger.debug("KalshiClient closed")
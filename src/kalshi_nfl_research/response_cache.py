@@ -0,0 +1,92 @@
+"""
+Disk-backed cache for raw Kalshi GET response bodies.
+
+Entries are keyed by (url, params) and stored zstd-compressed so repeated
+backtests over the same historical window skip the network entirely.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+import zstandard
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    On-disk cache of response bodies.
+
+    Each entry lives in `<cache_dir>/<blake2b(url, params)>.zst`; the file
+    modification time is used as the entry's age for TTL checks.
+    """
+
+    def __init__(self, cache_dir: str = "./.cache/kalshi", level: int = 3):
+        """
+        Initialize response cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing).
+            level: zstd compression level.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.level = level
+
+    def _path(self, url: str, params: Optional[dict[str, Any]]) -> Path:
+        """Map a request to its cache file path."""
+        key = orjson.dumps([url, sorted((params or {}).items())])
+        digest = hashlib.blake2b(key, digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.zst"
+
+    def get(
+        self, url: str, params: Optional[dict[str, Any]], ttl: float
+    ) -> Optional[bytes]:
+        """
+        Look up a cached response body.
+
+        Args:
+            url: Request URL.
+            params: Query parameters.
+            ttl: Maximum entry age in seconds (math.inf never expires).
+
+        Returns:
+            Decompressed body bytes, or None on miss/expiry. Expired and
+            corrupt entries are deleted.
+        """
+        path = self._path(url, params)
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                path.unlink(missing_ok=True)
+                return None
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            return zstandard.ZstdDecompressor().decompress(data)
+        except zstandard.ZstdError as e:
+            logger.warning(f"Discarding corrupt cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, url: str, params: Optional[dict[str, Any]], body: bytes) -> None:
+        """
+        Store a response body.
+
+        Args:
+            url: Request URL.
+            params: Query parameters.
+            body: Raw response body.
+        """
+        path = self._path(url, params)
+        tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(zstandard.ZstdCompressor(level=self.level).compress(body))
+        # Atomic rename so concurrent readers never see a partial entry
+        os.replace(tmp_path, path)
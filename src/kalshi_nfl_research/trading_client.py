@@ -1,16 +1,29 @@
 """
 Kalshi Trading API Client for placing real orders.
 """
+import functools
+import itertools
 import logging
+import os
 import time
-import uuid
-from typing import Optional, Literal
+from typing import Iterable, Optional, Literal
 from dataclasses import dataclass
 
 from kalshi_python import Configuration, KalshiClient as OfficialKalshiClient, PortfolioApi
 
 logger = logging.getLogger(__name__)
 
+# How long a batch get_orders snapshot answers get_order_status calls
+ORDER_STATUS_TTL_SEC = 0.5
+
+# Snapshot statuses that get_order_status reports as None, matching the 404 a
+# single-order lookup gives once an order has left the active book
+_TERMINAL_ORDER_STATUSES = frozenset({"canceled", "executed"})
+
+# Client order IDs: ms timestamp + pid + per-process sequence is unique without RNG
+_ORDER_SEQ = itertools.count()
+_PID = os.getpid()
+
 
 @dataclass
 class Order:
@@ -24,6 +37,53 @@ class Order:
     status: str
 
 
+@dataclass(slots=True)
+class OrderStatus:
+    """Current state of a Kalshi order, as returned by get_order_status."""
+    order_id: str
+    status: str = "unknown"
+    ticker: Optional[str] = None
+    side: Optional[str] = None
+    action: Optional[str] = None
+    count: Optional[int] = None
+    filled_count: int = 0
+    yes_price: Optional[int] = None
+    no_price: Optional[int] = None
+
+
+@functools.lru_cache(maxsize=4)
+def _build_config(api_key: str, api_secret: str) -> Configuration:
+    """
+    Build (once per credential pair) the kalshi-python configuration.
+
+    Reconnecting with the same credentials reuses the parsed configuration.
+    """
+    # Convert literal \n in private key to actual newlines
+    api_secret = api_secret.replace('\\n', '\n')
+
+    config = Configuration(
+        host="https://api.elections.kalshi.com/trade-api/v2"
+    )
+    config.api_key_id = api_key
+    config.private_key_pem = api_secret
+    return config
+
+
+def _to_order_status(order, order_id: str) -> OrderStatus:
+    """Build an OrderStatus from a kalshi-python order object."""
+    return OrderStatus(
+        order_id=getattr(order, 'order_id', order_id),
+        status=getattr(order, 'status', "unknown"),
+        ticker=getattr(order, 'ticker', None),
+        side=getattr(order, 'side', None),
+        action=getattr(order, 'action', None),
+        count=getattr(order, 'count', None),
+        filled_count=getattr(order, 'filled_count', 0),
+        yes_price=getattr(order, 'yes_price', None),
+        no_price=getattr(order, 'no_price', None),
+    )
+
+
 class KalshiTradingClient:
     """
     Client for Kalshi Trading API.
@@ -37,17 +97,9 @@ class KalshiTradingClient:
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
     ):
-        # Convert literal \n in private key to actual newlines
-        if api_secret and '\\n' in api_secret:
-            api_secret = api_secret.replace('\\n', '\n')
-
         # Use official Kalshi client
         if api_key and api_secret:
-            config = Configuration(
-                host="https://api.elections.kalshi.com/trade-api/v2"
-            )
-            config.api_key_id = api_key
-            config.private_key_pem = api_secret
+            config = _build_config(api_key, api_secret)
             self.client = OfficialKalshiClient(config)
             self.portfolio_api = PortfolioApi(self.client)
             logger.info("Successfully authenticated with API key")
@@ -60,18 +112,23 @@ class KalshiTradingClient:
         else:
             raise ValueError("Must provide (api_key, api_secret)")
 
+        # Batch order-status snapshot used by get_order_status
+        self._status_cache: dict[str, OrderStatus] = {}
+        self._status_cache_at = float("-inf")
+
     def get_balance(self) -> int:
         """Get account balance in cents."""
         response = self.portfolio_api.get_balance()
         return response.balance
 
-    def get_positions(self) -> list[dict]:
-        """Get all open positions."""
+    def get_positions(self) -> list:
+        """Get all open positions as kalshi-python position objects."""
         response = self.portfolio_api.get_positions()
-        # Convert response to list of dicts for compatibility
-        if hasattr(response, 'positions') and response.positions is not None:
-            return [pos.to_dict() if hasattr(pos, 'to_dict') else pos for pos in response.positions]
-        return []
+        return getattr(response, 'positions', None) or []
+
+    def get_positions_raw(self) -> list[dict]:
+        """Get all open positions as dicts."""
+        return [pos.to_dict() if hasattr(pos, 'to_dict') else pos for pos in self.get_positions()]
 
     def place_order(
         self,
@@ -101,7 +158,7 @@ class KalshiTradingClient:
         )
 
         # Generate unique client order ID
-        client_order_id = f"order_{int(time.time())}_{str(uuid.uuid4())[:8]}"
+        client_order_id = f"order_{int(time.time() * 1000)}_{_PID}_{next(_ORDER_SEQ):08x}"
 
         # Place order through official API (pass as keyword arguments)
         response = self.portfolio_api.create_order(
@@ -135,32 +192,72 @@ class KalshiTradingClient:
         logger.info(f"Order {order_id} cancelled")
         return True
 
-    def get_order_status(self, order_id: str) -> dict:
+    def get_order_statuses(
+        self,
+        order_ids: Optional[Iterable[str]] = None,
+        status: Optional[str] = None,
+    ) -> dict[str, OrderStatus]:
+        """
+        Get the status of many orders with a single get_orders request.
+
+        Unfiltered results also refresh the short-lived cache that
+        get_order_status reads from.
+
+        Args:
+            order_ids: Only return these orders (all orders if None)
+            status: Filter by status (resting, canceled, executed, etc.)
+
+        Returns:
+            Dict of order_id -> OrderStatus
+        """
+        response = self.portfolio_api.get_orders(status=status)
+        statuses = {
+            order.order_id: _to_order_status(order, order.order_id)
+            for order in (getattr(response, 'orders', None) or [])
+        }
+
+        if status is None:
+            self._status_cache = statuses
+            self._status_cache_at = time.monotonic()
+
+        if order_ids is None:
+            return statuses
+        wanted = set(order_ids)
+        return {oid: st for oid, st in statuses.items() if oid in wanted}
+
+    def get_order_status(self, order_id: str) -> Optional[OrderStatus]:
         """
         Get status of an order.
 
-        Note: Kalshi returns 404 for executed orders (they're removed from active orders).
-        In that case, we return None to indicate the order is no longer queryable.
+        Served from the batch get_orders snapshot (refreshed at most every
+        ORDER_STATUS_TTL_SEC), so polling many orders costs one request.
+        Orders missing from the snapshot fall back to a single-order lookup.
+
+        Note: Kalshi returns 404 for executed/canceled orders (they're removed from
+        active orders). In that case, we return None to indicate the order is no
+        longer queryable. Orders the snapshot lists as executed or canceled also
+        return None, so callers resolve them through get_fills the same way.
         """
+        if time.monotonic() - self._status_cache_at > ORDER_STATUS_TTL_SEC:
+            try:
+                self.get_order_statuses()
+            except Exception as e:
+                # Don't retry the batch on every call; fall back to single lookups
+                logger.warning(f"Batch order status refresh failed: {e}")
+                self._status_cache = {}
+                self._status_cache_at = time.monotonic()
+        cached = self._status_cache.get(order_id)
+        if cached is not None:
+            if cached.status in _TERMINAL_ORDER_STATUSES:
+                return None
+            return cached
+
         try:
             response = self.portfolio_api.get_order(order_id=order_id)
-            # Convert response to dict for compatibility
-            if hasattr(response, 'order'):
-                order = response.order
-                return {
-                    "order": {
-                        "order_id": order.order_id if hasattr(order, 'order_id') else order_id,
-                        "status": order.status if hasattr(order, 'status') else "unknown",
-                        "ticker": order.ticker if hasattr(order, 'ticker') else None,
-                        "side": order.side if hasattr(order, 'side') else None,
-                        "action": order.action if hasattr(order, 'action') else None,
-                        "count": order.count if hasattr(order, 'count') else None,
-                        "filled_count": order.filled_count if hasattr(order, 'filled_count') else 0,
-                        "yes_price": order.yes_price if hasattr(order, 'yes_price') else None,
-                        "no_price": order.no_price if hasattr(order, 'no_price') else None,
-                    }
-                }
-            return {}
+            order = getattr(response, 'order', None)
+            if order is None:
+                return OrderStatus(order_id=order_id, status="pending")
+            return _to_order_status(order, order_id)
         except Exception as e:
             # 404 means order was executed/cancelled and removed from active orders
             if "404" in str(e) or "not_found" in str(e).lower():
@@ -11,18 +11,194 @@ Strategy:
 2. Wait for price drop to ≤40%
 3. Enter with tiered position sizing
 4. Exit at target range or hold to outcome for deep dips
+
+The in-game (current) and legacy variants of the rules differ only in a few
+parameters, captured by NHLStrategyConfig (INGAME_CONFIG / LEGACY_CONFIG).
 """
 
 import os
+from dataclasses import dataclass
 from typing import Dict, Tuple, Optional
 from datetime import datetime
 
+import numpy as np
+from numba import njit, prange
+
+
+# Resolved once at import; override with set_position_multiplier()
+_POS_MULT = float(os.environ.get('POSITION_SIZE_MULTIPLIER', '1.0'))
+
+
+def set_position_multiplier(multiplier: float) -> None:
+    """
+    Override the POSITION_SIZE_MULTIPLIER read at import.
+
+    Args:
+        multiplier: New position size multiplier
+    """
+    global _POS_MULT
+    _POS_MULT = float(multiplier)
+
+
+@dataclass(slots=True, frozen=True)
+class NHLStrategyConfig:
+    """Parameters that distinguish the strategy variants."""
+    max_entry_price: float = 45.0  # Enter only below this price
+    skip_46_50: bool = False  # Never exit while price sits in the 46-50¢ band
+    force_close_at_window: bool = True  # False: hold unexited positions to outcome
+    deep_dip_bounce_threshold: float = 45.0  # Deep-dip (≤35¢) strong-bounce exit price
+
+
+# 90-minute in-game window, force-closed at window end (live trading)
+INGAME_CONFIG = NHLStrategyConfig()
+
+# Original pregame variant: ≤40¢ entries, skip the 46-50¢ band, hold to outcome
+LEGACY_CONFIG = NHLStrategyConfig(
+    max_entry_price=40.0,
+    skip_46_50=True,
+    force_close_at_window=False,
+)
+
+
+# Per-cent lookup tables (index = int(price), 0-100) for the piecewise rules.
+# numba freezes these into compiled code, so treat them as constants.
+_SIZE_MULT = np.empty(101, dtype=np.float32)
+_SIZE_MULT[:36] = 1.5    # ≤35: deep dip
+_SIZE_MULT[36:40] = 1.0  # 36-39: medium dip
+_SIZE_MULT[40:] = 0.5    # ≥40: shallow dip
+
+_EXIT_LO = np.empty(101, dtype=np.float64)
+_EXIT_HI = np.empty(101, dtype=np.float64)
+_EXIT_LO[:40], _EXIT_HI[:40] = 10.0, 15.0  # Deep dip: target larger move
+_EXIT_LO[40:], _EXIT_HI[40:] = 3.0, 6.0    # Shallow dip: take quick profit
+
+
+# Exit reason codes returned by _should_exit_core
+EXIT_HIT_TARGET = 0
+EXIT_ABOVE_TARGET = 1
+EXIT_DEEP_DIP_BOUNCE = 2
+EXIT_DEEP_DIP_MONITORING = 3
+EXIT_SHALLOW_BOUNCE = 4
+EXIT_SHALLOW_MONITORING = 5
+EXIT_MONITORING = 6
+EXIT_FORCE_CLOSE = 7  # Only from simulate_trades: window closed while holding
+EXIT_SKIP_BAND = 8
+EXIT_DEEP_DIP_HOLD = 9
+EXIT_HOLD_TO_OUTCOME = 10  # Only from simulate_trades: still held at window close
+
+# Fixed reason strings for the non-exit codes of should_exit_position
+_MONITORING_REASONS = {
+    EXIT_DEEP_DIP_MONITORING: "deep_dip_monitoring",
+    EXIT_SHALLOW_MONITORING: "shallow_monitoring",
+    EXIT_MONITORING: "monitoring",
+    EXIT_SKIP_BAND: "in_46_50_band",
+    EXIT_DEEP_DIP_HOLD: "deep_dip_hold_to_outcome",
+}
+
+
+@njit(cache=True)
+def _should_enter_core(
+    current_price: float,
+    opening_price: float,
+    min_favorite_threshold: float,
+    max_entry_price: float
+) -> bool:
+    """Compiled core of should_enter_position."""
+    # Must have started as a favorite, and be below the entry threshold now.
+    # Written as negated rejections so NaN inputs pass, as the original
+    # early-return checks did.
+    return not (opening_price < min_favorite_threshold) and not (current_price >= max_entry_price)
+
+
+@njit(cache=True)
+def _price_index(price: float) -> int:
+    """
+    Lookup-table index for a price, clamped to 0-100.
+
+    NaN maps to 0, the tier the original if-chains fell through to. The core
+    functions are compiled without fastmath so NaN checks and comparisons
+    keep IEEE semantics.
+    """
+    if price != price:
+        return 0
+    return int(min(max(price, 0.0), 100.0))
+
+
+@njit(cache=True)
+def _position_size_core(
+    entry_price: float,
+    base_position_size: float,
+    multiplier: float
+) -> float:
+    """Compiled core of get_position_size."""
+    return base_position_size * _SIZE_MULT[_price_index(entry_price)] * multiplier
+
+
+@njit(cache=True)
+def _exit_targets_core(entry_price: float) -> Tuple[float, float]:
+    """Compiled core of get_exit_targets."""
+    i = _price_index(entry_price)
+    return (entry_price + _EXIT_LO[i], entry_price + _EXIT_HI[i])
+
+
+@njit(cache=True)
+def _should_exit_core(
+    entry_price: float,
+    current_price: float,
+    time_in_position_minutes: int,
+    skip_46_50: bool,
+    force_close_at_window: bool,
+    deep_dip_bounce_threshold: float
+) -> Tuple[bool, int]:
+    """
+    Compiled core of should_exit_position (config fields passed as scalars).
+
+    Returns:
+        Tuple of (should_exit, EXIT_* reason code)
+    """
+    # Legacy variant never exits inside the 46-50¢ band
+    if skip_46_50 and 46 <= current_price <= 50:
+        return (False, EXIT_SKIP_BAND)
+
+    exit_min, exit_max = _exit_targets_core(entry_price)
+
+    # Check if we've hit target range - TAKE PROFIT
+    if exit_min <= current_price <= exit_max:
+        return (True, EXIT_HIT_TARGET)
+
+    # If price jumped above our target range, exit immediately
+    if current_price > exit_max:
+        return (True, EXIT_ABOVE_TARGET)
+
+    # Deep dips (≤35¢): More patient, let it bounce
+    if entry_price <= 35:
+        # Within 90-min window, hold for bigger bounce
+        if current_price >= deep_dip_bounce_threshold:
+            # Strong bounce, take profit
+            return (True, EXIT_DEEP_DIP_BOUNCE)
+        # Otherwise keep monitoring (force closed at 90min, or held to outcome)
+        if force_close_at_window:
+            return (False, EXIT_DEEP_DIP_MONITORING)
+        return (False, EXIT_DEEP_DIP_HOLD)
+
+    # Shallow/medium dips (36-44¢): Take quick profits
+    if entry_price >= 36:
+        # If we've recovered back to entry + 3-6¢, exit
+        if current_price >= entry_price + 3:
+            return (True, EXIT_SHALLOW_BOUNCE)
+        # Otherwise keep monitoring
+        return (False, EXIT_SHALLOW_MONITORING)
+
+    # Default: keep monitoring
+    return (False, EXIT_MONITORING)
+
 
 def should_enter_position(
     current_price: float,
     opening_price: float,
     min_favorite_threshold: float = 57.0,
-    max_entry_price: float = 45.0
+    max_entry_price: Optional[float] = None,
+    config: NHLStrategyConfig = INGAME_CONFIG
 ) -> bool:
     """
     Determine if we should enter a position.
@@ -31,20 +207,19 @@ def should_enter_position(
         current_price: Current market price (YES side, 0-100)
         opening_price: Opening price when market first appeared
         min_favorite_threshold: Minimum opening price to qualify as favorite
-        max_entry_price: Maximum price to enter (below 45 = 44 or less)
+        max_entry_price: Maximum price to enter (below 45 = 44 or less).
+            Defaults to config.max_entry_price.
+        config: Strategy variant
 
     Returns:
         True if we should enter, False otherwise
     """
-    # Must have started as a favorite
-    if opening_price < min_favorite_threshold:
-        return False
-
-    # Current price must be below entry threshold (44 or less)
-    if current_price >= max_entry_price:
-        return False
-
-    return True
+    if max_entry_price is None:
+        max_entry_price = config.max_entry_price
+    return bool(_should_enter_core(
+        float(current_price), float(opening_price),
+        float(min_favorite_threshold), float(max_entry_price)
+    ))
 
 
 def get_position_size(
@@ -66,17 +241,7 @@ def get_position_size(
     Returns:
         Position size in dollars
     """
-    multiplier = float(os.getenv('POSITION_SIZE_MULTIPLIER', '1.0'))
-
-    if entry_price >= 40:
-        # Shallow dip: 0.5x
-        return base_position_size * 0.5 * multiplier
-    elif entry_price >= 36:
-        # Medium dip: 1.0x
-        return base_position_size * 1.0 * multiplier
-    else:  # entry_price <= 35
-        # Deep dip: 1.5x (best performance)
-        return base_position_size * 1.5 * multiplier
+    return _position_size_core(float(entry_price), float(base_position_size), _POS_MULT)
 
 
 def get_exit_targets(entry_price: float) -> Tuple[float, float]:
@@ -93,91 +258,161 @@ def get_exit_targets(entry_price: float) -> Tuple[float, float]:
     Returns:
         Tuple of (exit_min, exit_max) in cents
     """
-    if entry_price >= 40:
-        # Shallow dip: Take quick profit
-        return (entry_price + 3, entry_price + 6)
-    else:
-        # Deep dip: Target larger move
-        return (entry_price + 10, entry_price + 15)
+    # Integer offsets keep the input's type (int in -> int out), as before
+    i = _price_index(float(entry_price))
+    return (entry_price + int(_EXIT_LO[i]), entry_price + int(_EXIT_HI[i]))
 
 
 def should_exit_position(
     entry_price: float,
     current_price: float,
-    time_in_position_minutes: int
+    time_in_position_minutes: int,
+    config: NHLStrategyConfig = INGAME_CONFIG
 ) -> Tuple[bool, str]:
     """
     Determine if we should exit a position during the 90-minute window.
 
     This is for in-game monitoring ONLY (puck drop + 90 minutes).
-    All positions are force-closed at the 90-minute mark.
+    With INGAME_CONFIG all positions are force-closed at the 90-minute mark;
+    LEGACY_CONFIG holds deep dips to outcome instead.
 
     Args:
         entry_price: Price at which we entered
         current_price: Current market price
         time_in_position_minutes: How long we've been in the position
+        config: Strategy variant
 
     Returns:
         Tuple of (should_exit, reason)
     """
-    exit_min, exit_max = get_exit_targets(entry_price)
+    should_exit, code = _should_exit_core(
+        float(entry_price), float(current_price), int(time_in_position_minutes),
+        config.skip_46_50, config.force_close_at_window,
+        float(config.deep_dip_bounce_threshold)
+    )
+
+    if code == EXIT_HIT_TARGET:
+        exit_min, exit_max = get_exit_targets(entry_price)
+        reason = f"hit_target_range_{exit_min}-{exit_max}¢"
+    elif code == EXIT_ABOVE_TARGET:
+        reason = f"price_above_target_{current_price}¢"
+    elif code == EXIT_DEEP_DIP_BOUNCE:
+        reason = f"deep_dip_strong_bounce_{current_price}¢"
+    elif code == EXIT_SHALLOW_BOUNCE:
+        reason = f"shallow_bounce_{current_price}¢"
+    else:
+        reason = _MONITORING_REASONS[code]
 
-    # Check if we've hit target range - TAKE PROFIT
-    if exit_min <= current_price <= exit_max:
-        return (True, f"hit_target_range_{exit_min}-{exit_max}¢")
+    return (bool(should_exit), reason)
 
-    # If price jumped above our target range, exit immediately
-    if current_price > exit_max:
-        return (True, f"price_above_target_{current_price}¢")
 
-    # Deep dips (≤35¢): More patient, let it bounce
-    if entry_price <= 35:
-        # Within 90-min window, hold for bigger bounce
-        if current_price >= 45:
-            # Strong bounce, take profit
-            return (True, f"deep_dip_strong_bounce_{current_price}¢")
-        # Otherwise keep monitoring (will force close at 90min)
-        return (False, "deep_dip_monitoring")
+@njit(parallel=True, cache=True)
+def simulate_trades(
+    prices: np.ndarray,
+    opens: np.ndarray,
+    min_favorite_threshold: float = 57.0,
+    max_entry_price: float = 45.0,
+    base_position_size: float = 100.0,
+    multiplier: float = 1.0,
+    skip_46_50: bool = False,
+    force_close_at_window: bool = True,
+    deep_dip_bounce_threshold: float = 45.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the entry/exit rules over many games at once (games run in parallel).
 
-    # Shallow/medium dips (36-44¢): Take quick profits
-    if entry_price >= 36:
-        # If we've recovered back to entry + 3-6¢, exit
-        if current_price >= entry_price + 3:
-            return (True, f"shallow_bounce_{current_price}¢")
-        # Otherwise keep monitoring
-        return (False, "shallow_monitoring")
+    Each game enters at the first minute that passes should_enter_position,
+    then exits at the first later minute that should_exit_position accepts.
+    Positions still open at the last priced minute are force-closed there
+    (EXIT_FORCE_CLOSE) or, without force_close_at_window, left to settle at
+    the outcome (EXIT_HOLD_TO_OUTCOME, exit_idx = last priced minute).
 
-    # Default: keep monitoring
-    return (False, "monitoring")
+    The strategy variant is given as the NHLStrategyConfig fields
+    (max_entry_price, skip_46_50, ...) since compiled code can't take the
+    dataclass itself.
 
+    Args:
+        prices: (n_games, n_minutes) YES prices per in-game minute, NaN where
+            a game has no price (e.g. padding after a shorter game)
+        opens: (n_games,) opening price of each game's favorite
+        min_favorite_threshold: Minimum opening price to qualify as favorite
+        max_entry_price: Maximum price to enter
+        base_position_size: Base position size in dollars
+        multiplier: Position size multiplier
+        skip_46_50: See NHLStrategyConfig
+        force_close_at_window: See NHLStrategyConfig
+        deep_dip_bounce_threshold: See NHLStrategyConfig
 
-def calculate_expected_value(
-    entry_price: float,
+    Returns:
+        Tuple of per-game arrays (entry_idx, exit_idx, exit_code, position_size).
+        entry_idx/exit_idx are minute indices (-1 if no trade), exit_code is an
+        EXIT_* code (-1 if no trade), position_size is in dollars (0 if no trade).
+    """
+    n_games, n_minutes = prices.shape
+    entry_idx = np.full(n_games, -1, dtype=np.int64)
+    exit_idx = np.full(n_games, -1, dtype=np.int64)
+    exit_code = np.full(n_games, -1, dtype=np.int64)
+    position_size = np.zeros(n_games, dtype=np.float64)
+
+    for g in prange(n_games):
+        entry = -1
+        for t in range(n_minutes):
+            p = prices[g, t]
+            if not np.isnan(p) and _should_enter_core(p, opens[g], min_favorite_threshold, max_entry_price):
+                entry = t
+                break
+        if entry < 0:
+            continue
+
+        entry_price = prices[g, entry]
+        entry_idx[g] = entry
+        position_size[g] = _position_size_core(entry_price, base_position_size, multiplier)
+
+        last = entry
+        for t in range(entry + 1, n_minutes):
+            p = prices[g, t]
+            if np.isnan(p):
+                continue
+            last = t
+            should_exit, code = _should_exit_core(
+                entry_price, p, t - entry,
+                skip_46_50, force_close_at_window, deep_dip_bounce_threshold
+            )
+            if should_exit:
+                exit_idx[g] = t
+                exit_code[g] = code
+                break
+
+        if exit_idx[g] < 0:
+            exit_idx[g] = last
+            exit_code[g] = EXIT_FORCE_CLOSE if force_close_at_window else EXIT_HOLD_TO_OUTCOME
+
+    return entry_idx, exit_idx, exit_code, position_size
+
+
+def calculate_expected_value_batch(
+    entry_prices: np.ndarray,
     historical_win_rate: Optional[float] = None
-) -> Dict[str, float]:
+) -> Dict[str, np.ndarray]:
     """
-    Calculate expected value based on entry price and historical performance.
+    Calculate expected value for many entry prices at once.
 
     Args:
-        entry_price: Price at which we're considering entry
+        entry_prices: Prices at which we're considering entry
         historical_win_rate: Optional override for win rate (defaults to backtest data)
 
     Returns:
-        Dict with EV metrics
+        Dict of EV metric -> array aligned with entry_prices
     """
-    # Historical performance from backtest
-    if entry_price <= 35:
-        win_rate = historical_win_rate or 0.95
-        avg_win = 24.60
-        avg_loss = -18.0
-    elif entry_price <= 40:
-        win_rate = historical_win_rate or 0.94
-        avg_win = 4.94
-        avg_loss = -18.0
-    else:  # 41-45
-        win_rate = historical_win_rate or 0.88
-        avg_win = 1.17
-        avg_loss = -3.6
+    p = np.asarray(entry_prices, dtype=np.float64)
+
+    # Historical performance from backtest: ≤35, 36-40, 41-45 (and above)
+    conds = [p <= 35, p <= 40]
+    win_rate = np.select(conds, [0.95, 0.94], default=0.88)
+    if historical_win_rate:
+        win_rate = np.full_like(p, historical_win_rate)
+    avg_win = np.select(conds, [24.60, 4.94], default=1.17)
+    avg_loss = np.select(conds, [-18.0, -18.0], default=-3.6)
 
     expected_value = (win_rate * avg_win) + ((1 - win_rate) * avg_loss)
 
@@ -186,10 +421,28 @@ def calculate_expected_value(
         'win_rate': win_rate,
         'avg_win': avg_win,
         'avg_loss': avg_loss,
-        'profit_factor': abs(avg_win / avg_loss) if avg_loss != 0 else float('inf')
+        'profit_factor': np.abs(avg_win / avg_loss)
     }
 
 
+def calculate_expected_value(
+    entry_price: float,
+    historical_win_rate: Optional[float] = None
+) -> Dict[str, float]:
+    """
+    Calculate expected value based on entry price and historical performance.
+
+    Args:
+        entry_price: Price at which we're considering entry
+        historical_win_rate: Optional override for win rate (defaults to backtest data)
+
+    Returns:
+        Dict with EV metrics
+    """
+    batch = calculate_expected_value_batch(np.array([entry_price]), historical_win_rate)
+    return {k: float(v[0]) for k, v in batch.items()}
+
+
 def get_strategy_summary() -> str:
     """Return a summary of the strategy for logging."""
     return """
@@ -1,15 +1,84 @@
 """
 Supabase Logger - Writes trading bot data to Supabase for dashboard visualization
 """
+import asyncio
 import os
 import logging
+import random
 import time
-from typing import Optional
+from typing import Awaitable, Optional
 from functools import wraps
+from urllib.parse import urlsplit
+
+import asyncpg
 from supabase import create_client, Client
 
 logger = logging.getLogger(__name__)
 
+# Columns AsyncSupabaseLogger.log_game accepts from its game_data dict
+_GAME_COLUMNS = (
+    'market_ticker', 'event_ticker', 'market_title', 'yes_subtitle',
+    'kickoff_ts', 'halftime_ts', 'pregame_prob', 'status',
+)
+
+# Buffered rows are written once this many pile up or this many seconds pass
+_BATCH_MAX_ROWS = 500
+_BATCH_FLUSH_SEC = 1.0
+
+# Supavisor's transaction-mode port; server-side prepared statements don't
+# survive there because consecutive statements may land on different backends
+_TRANSACTION_POOLER_PORT = 6543
+
+# Cap on writes in flight at once from gather()/fire_and_forget(); kept below
+# the pool's max_size
+_MAX_CONCURRENT_WRITES = 20
+
+# fire_and_forget() drops new writes once this many are still outstanding
+_MAX_BACKGROUND_WRITES = 1000
+
+_TICK_INSERT = (
+    "INSERT INTO market_ticks (market_ticker, game_id, timestamp, favorite_price, yes_ask, no_ask) "
+    "VALUES ($1, (SELECT id FROM games WHERE market_ticker = $1), $2, $3, $4, $5)"
+)
+_BANKROLL_INSERT = (
+    "INSERT INTO bankroll_history (timestamp, amount, change, game_id, description) "
+    "VALUES ($1, $2, $3, $4, $5)"
+)
+
+# Order fields returned by get_order/get_pending_orders
+_ORDER_COLUMNS = 'id, order_id, price, size, filled_size, status, side'
+
+# Hot UPDATEs are kept as fixed strings: asyncpg's per-connection statement
+# cache keys on query text, so each is parsed and planned once per connection
+# and reused after that (unless the cache is disabled for a pooler).
+_GAME_STATUS_UPDATE = (
+    "UPDATE games SET status = $2, pregame_prob = COALESCE($3, pregame_prob) "
+    "WHERE market_ticker = $1"
+)
+_GAME_ELIGIBILITY_UPDATE = (
+    "UPDATE games SET is_eligible = $2 WHERE market_ticker = $1"
+)
+_ORDER_STATUS_UPDATE = (
+    "UPDATE orders SET status = $2, filled_size = $3 WHERE order_id = $1"
+)
+
+# Checkpoint odds column -> its UPDATE; also the whitelist of column names
+# allowed into the SQL text
+_CHECKPOINT_UPDATES = {
+    field_name: (
+        f"UPDATE games SET {field_name} = $2, {field_name.replace('odds', 'checkpoint')}_ts = $3 "
+        "WHERE market_ticker = $1"
+    )
+    for field_name in ('odds_6h', 'odds_3h', 'odds_30m')
+}
+_CHECKPOINT_ELIGIBILITY_UPDATES = {
+    field_name: (
+        f"UPDATE games SET {field_name} = $2, {field_name.replace('odds', 'checkpoint')}_ts = $3, "
+        "is_eligible = $4 WHERE market_ticker = $1"
+    )
+    for field_name in _CHECKPOINT_UPDATES
+}
+
 
 def retry_on_failure(max_retries=3, delay=1):
     """Retry database operations with exponential backoff."""
@@ -33,11 +102,50 @@ def retry_on_failure(max_retries=3, delay=1):
     return decorator
 
 
+# Errors worth retrying: the connection or the server went away, not the statement
+_TRANSIENT_DB_ERRORS = (
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+    ConnectionError,
+    asyncio.TimeoutError,
+)
+
+
+def retry_db_operation(max_retries=6, base=0.1, cap=10):
+    """
+    Retry async database operations on transient errors.
+
+    Backoff is exponential with jitter and awaited, so the event loop keeps
+    running. Anything else (constraint violations, bad SQL) raises at once.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    return await func(*args, **kwargs)
+                except _TRANSIENT_DB_ERRORS as e:
+                    if attempt < max_retries - 1:
+                        wait_time = min(cap, base * (2 ** attempt)) + random.uniform(0, 0.1)
+                        logger.warning(f"Database update failed (attempt {attempt + 1}/{max_retries}), "
+                                      f"retrying in {wait_time:.2f}s: {e}")
+                        await asyncio.sleep(wait_time)
+                    else:
+                        logger.error(f"Database update failed after {max_retries} attempts: {e}")
+                        raise
+            return None
+        return wrapper
+    return decorator
+
+
 class SupabaseLogger:
     """Handles all Supabase writes for the trading bot."""
 
     def __init__(self):
         """Initialize Supabase client from environment variables."""
+        # market_ticker -> games.id; ids never change once a game row exists
+        self._game_id_cache: dict[str, str] = {}
+
         url = os.getenv("SUPABASE_URL")
         key = os.getenv("SUPABASE_ANON_KEY")
 
@@ -54,6 +162,15 @@ class SupabaseLogger:
             logger.error(f"Failed to connect to Supabase: {e}")
             self.client = None
 
+    def _get_game_id(self, market_ticker: str) -> Optional[str]:
+        """Resolve a game's id, querying only on a cache miss."""
+        game_id = self._game_id_cache.get(market_ticker)
+        if game_id is None:
+            game = self.client.table('games').select('id').eq('market_ticker', market_ticker).execute()
+            if game.data:
+                game_id = self._game_id_cache[market_ticker] = game.data[0]['id']
+        return game_id
+
     def log_game(self, game_data: dict) -> Optional[str]:
         """
         Log a new game to the database.
@@ -69,17 +186,11 @@ class SupabaseLogger:
             return None
 
         try:
-            # Check if game already exists
-            existing = self.client.table('games').select('id').eq('market_ticker', game_data['market_ticker']).execute()
-
-            if existing.data:
-                return existing.data[0]['id']
-
-            # Insert new game
-            result = self.client.table('games').insert(game_data).execute()
+            # Insert, or merge into the existing row; either way the row comes back
+            result = self.client.table('games').upsert(game_data, on_conflict='market_ticker').execute()
 
             if result.data:
-                game_id = result.data[0]['id']
+                game_id = self._game_id_cache[game_data['market_ticker']] = result.data[0]['id']
                 logger.debug(f"Logged game to Supabase: {game_data['market_ticker']}")
                 return game_id
 
@@ -94,7 +205,7 @@ class SupabaseLogger:
             return
 
         try:
-            update_data = {'status': status, 'updated_at': 'now()'}
+            update_data = {'status': status}
             if pregame_prob is not None:
                 update_data['pregame_prob'] = pregame_prob
 
@@ -122,8 +233,7 @@ class SupabaseLogger:
 
             update_data = {
                 field_name: odds,
-                timestamp_field: timestamp,
-                'updated_at': 'now()'
+                timestamp_field: timestamp
             }
 
             self.client.table('games').update(update_data).eq('market_ticker', market_ticker).execute()
@@ -131,6 +241,35 @@ class SupabaseLogger:
         except Exception as e:
             logger.error(f"Error updating checkpoint {field_name}: {e}")
 
+    def update_game_checkpoint_and_eligibility(self, market_ticker: str, field_name: str, odds: float,
+                                               timestamp: int, is_eligible: bool):
+        """
+        Update checkpoint odds and eligibility with a single request.
+
+        Args:
+            market_ticker: Market ticker to identify the game
+            field_name: Name of the checkpoint field ('odds_6h', 'odds_3h', 'odds_30m')
+            odds: The odds value (0-1 probability)
+            timestamp: Unix timestamp when the checkpoint was captured
+            is_eligible: Whether the game is eligible for trading based on checkpoint rules
+        """
+        if not self.client:
+            return
+
+        try:
+            timestamp_field = field_name.replace('odds', 'checkpoint') + '_ts'
+
+            update_data = {
+                field_name: odds,
+                timestamp_field: timestamp,
+                'is_eligible': is_eligible
+            }
+
+            self.client.table('games').update(update_data).eq('market_ticker', market_ticker).execute()
+            logger.debug(f"Updated {field_name}: {market_ticker} -> {odds:.0%} (eligible={is_eligible})")
+        except Exception as e:
+            logger.error(f"Error updating checkpoint {field_name}: {e}")
+
     def update_game_eligibility(self, market_ticker: str, is_eligible: bool):
         """
         Update the eligibility status for a game.
@@ -144,8 +283,7 @@ class SupabaseLogger:
 
         try:
             update_data = {
-                'is_eligible': is_eligible,
-                'updated_at': 'now()'
+                'is_eligible': is_eligible
             }
 
             self.client.table('games').update(update_data).eq('market_ticker', market_ticker).execute()
@@ -168,17 +306,21 @@ class SupabaseLogger:
         if not self.client:
             return None
 
-        # Get game_id from market_ticker
-        game = self.client.table('games').select('id').eq('market_ticker', position_data['market_ticker']).execute()
+        game_id = self._get_game_id(position_data['market_ticker'])
 
-        if not game.data:
+        if game_id is None:
             logger.warning(f"Game not found for position: {position_data['market_ticker']}")
             return None
 
-        position_data['game_id'] = game.data[0]['id']
+        position_data['game_id'] = game_id
         position_data['status'] = 'open'
 
-        result = self.client.table('positions').insert(position_data).execute()
+        try:
+            result = self.client.table('positions').insert(position_data).execute()
+        except Exception:
+            # Don't let a stale id survive into the retry
+            self._game_id_cache.pop(position_data['market_ticker'], None)
+            raise
 
         if result.data:
             position_id = result.data[0]['id']
@@ -188,22 +330,25 @@ class SupabaseLogger:
         return None
 
     @retry_on_failure(max_retries=3, delay=1)
-    def log_position_exit(self, market_ticker: str, exit_price: int, exit_time: int, pnl: float):
-        """Update position with exit details and calculate P&L."""
+    def log_position_exit(self, position_id: str, exit_price: int, exit_time: int, pnl: float):
+        """
+        Update position with exit details and calculate P&L.
+
+        Args:
+            position_id: ID returned by log_position_entry
+        """
         if not self.client:
             return
 
-        # Update all open positions for this market
         update_data = {
             'exit_price': exit_price,
             'exit_time': exit_time,
             'pnl': pnl,
-            'status': 'closed',
-            'updated_at': 'now()'
+            'status': 'closed'
         }
 
-        self.client.table('positions').update(update_data).eq('market_ticker', market_ticker).eq('status', 'open').execute()
-        logger.debug(f"Logged position exit: {market_ticker} P&L=${pnl:+.2f}")
+        self.client.table('positions').update(update_data).eq('id', position_id).execute()
+        logger.debug(f"Logged position exit: {position_id} P&L=${pnl:+.2f}")
 
     @retry_on_failure(max_retries=3, delay=1)
     def update_position_status(self, order_id: str, status: str, exit_price: Optional[int] = None, pnl: Optional[float] = None):
@@ -220,8 +365,7 @@ class SupabaseLogger:
             return
 
         update_data = {
-            'status': status,
-            'updated_at': 'now()'
+            'status': status
         }
 
         if status == 'closed':
@@ -270,14 +414,9 @@ class SupabaseLogger:
             return
 
         try:
-            # Get game_id from market_ticker
-            game = self.client.table('games').select('id').eq('market_ticker', market_ticker).execute()
-
-            game_id = game.data[0]['id'] if game.data else None
-
             data = {
                 'market_ticker': market_ticker,
-                'game_id': game_id,
+                'game_id': self._get_game_id(market_ticker),
                 'timestamp': timestamp,
                 'favorite_price': favorite_price,
                 'yes_ask': yes_ask,
@@ -289,6 +428,7 @@ class SupabaseLogger:
             logger.debug(f"Logged price tick: {market_ticker} @ {favorite_price:.0%}")
 
         except Exception as e:
+            self._game_id_cache.pop(market_ticker, None)
             logger.error(f"Error logging price tick: {e}")
 
     def log_order(self, market_ticker: str, order_id: str, price: int, size: int, side: str = 'buy') -> Optional[str]:
@@ -309,15 +449,14 @@ class SupabaseLogger:
             return None
 
         try:
-            # Get game_id from market_ticker
-            game = self.client.table('games').select('id').eq('market_ticker', market_ticker).execute()
+            game_id = self._get_game_id(market_ticker)
 
-            if not game.data:
+            if game_id is None:
                 logger.warning(f"Game not found for order: {market_ticker}")
                 return None
 
             order_data = {
-                'game_id': game.data[0]['id'],
+                'game_id': game_id,
                 'market_ticker': market_ticker,
                 'order_id': order_id,
                 'price': price,
@@ -334,6 +473,7 @@ class SupabaseLogger:
                 return result.data[0]['id']
 
         except Exception as e:
+            self._game_id_cache.pop(market_ticker, None)
             logger.error(f"Error logging order: {e}")
 
         return None
@@ -353,8 +493,7 @@ class SupabaseLogger:
 
         update_data = {
             'status': status,
-            'filled_size': filled_size,
-            'updated_at': 'now()'
+            'filled_size': filled_size
         }
 
         self.client.table('orders').update(update_data).eq('order_id', order_id).execute()
@@ -374,7 +513,7 @@ class SupabaseLogger:
             return []
 
         try:
-            result = self.client.table('orders').select('*').eq('market_ticker', market_ticker).eq('status', 'pending').execute()
+            result = self.client.table('orders').select(_ORDER_COLUMNS).eq('market_ticker', market_ticker).eq('status', 'pending').execute()
             return result.data if result.data else []
 
         except Exception as e:
@@ -395,9 +534,591 @@ class SupabaseLogger:
             return None
 
         try:
-            result = self.client.table('orders').select('*').eq('order_id', order_id).execute()
+            result = self.client.table('orders').select(_ORDER_COLUMNS).eq('order_id', order_id).execute()
             return result.data[0] if result.data else None
 
         except Exception as e:
             logger.error(f"Error getting order {order_id}: {e}")
             return None
+
+
+class AsyncSupabaseLogger:
+    """
+    asyncio variant of SupabaseLogger that talks to Postgres directly.
+
+    Writes go over a pooled asyncpg connection instead of one PostgREST
+    HTTP request per call. Methods mirror SupabaseLogger's and keep the
+    same return values and error behaviour.
+    """
+
+    def __init__(self, dsn: Optional[str] = None, min_size: int = 10, max_size: int = 50,
+                 statement_cache_size: Optional[int] = None):
+        """
+        Store pool settings; call `await connect()` before logging.
+
+        Args:
+            dsn: Postgres connection string (defaults to SUPABASE_DB_URL)
+            min_size: Connections opened up front
+            max_size: Upper bound on pooled connections
+            statement_cache_size: Per-connection prepared statement cache. Defaults
+                                  to 0 for a transaction pooler DSN (port 6543),
+                                  otherwise asyncpg's 100.
+        """
+        self.dsn = dsn or os.getenv("SUPABASE_DB_URL")
+        self.min_size = min_size
+        self.max_size = max_size
+        if statement_cache_size is None:
+            behind_pooler = bool(self.dsn) and urlsplit(self.dsn).port == _TRANSACTION_POOLER_PORT
+            statement_cache_size = 0 if behind_pooler else 100
+        self.statement_cache_size = statement_cache_size
+        self.pool: Optional[asyncpg.Pool] = None
+        self._tick_queue: asyncio.Queue = asyncio.Queue()
+        self._bankroll_queue: asyncio.Queue = asyncio.Queue()
+        self._flushers: list[asyncio.Task] = []
+        self._write_slots = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+        # Strong references; the event loop only keeps weak ones to tasks
+        self._background: set[asyncio.Task] = set()
+
+    async def connect(self):
+        """Create the connection pool. Leaves the logger disabled on failure."""
+        if not self.dsn:
+            logger.warning("⚠️  Supabase database URL not found. Dashboard will not update.")
+            logger.warning("   Set the SUPABASE_DB_URL environment variable.")
+            return
+
+        try:
+            self.pool = await asyncpg.create_pool(
+                self.dsn,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                max_inactive_connection_lifetime=300,
+                command_timeout=60,
+                statement_cache_size=self.statement_cache_size,
+                # Queries here are tiny; JIT compilation only adds latency
+                server_settings={'jit': 'off'},
+            )
+            logger.info("✓ Connected to Supabase Postgres"
+                        + (" (transaction pooler)" if self.statement_cache_size == 0 else ""))
+        except Exception as e:
+            logger.error(f"Failed to connect to Supabase Postgres: {e}")
+            self.pool = None
+            return
+
+        self._flushers = [
+            asyncio.create_task(self._flush_loop(self._tick_queue, _TICK_INSERT, 'price tick')),
+            asyncio.create_task(self._flush_loop(self._bankroll_queue, _BANKROLL_INSERT, 'bankroll')),
+        ]
+
+    async def close(self):
+        """Flush buffered rows, then close all pooled connections."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+        if self._flushers:
+            # None tells each flusher to write what it has and stop
+            self._tick_queue.put_nowait(None)
+            self._bankroll_queue.put_nowait(None)
+            await asyncio.gather(*self._flushers)
+            self._flushers = []
+
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+
+    async def _flush_loop(self, queue: asyncio.Queue, query: str, label: str):
+        """
+        Drain `queue` into `query` with one executemany per batch.
+
+        A batch closes at _BATCH_MAX_ROWS rows or _BATCH_FLUSH_SEC after its
+        first row, whichever comes first.
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            row = await queue.get()
+            if row is None:
+                return
+
+            batch = [row]
+            deadline = loop.time() + _BATCH_FLUSH_SEC
+            while len(batch) < _BATCH_MAX_ROWS:
+                try:
+                    row = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+
+            try:
+                async with self.pool.acquire() as conn:
+                    await conn.executemany(query, batch)
+                logger.debug(f"Flushed {len(batch)} {label} rows")
+            except Exception as e:
+                logger.error(f"Error flushing {len(batch)} {label} rows: {e}")
+
+    async def _bounded(self, coro: Awaitable):
+        """Await `coro` once a write slot is free."""
+        async with self._write_slots:
+            return await coro
+
+    async def gather(self, *coros: Awaitable) -> list:
+        """
+        Run independent logger calls concurrently across pooled connections.
+
+        At most _MAX_CONCURRENT_WRITES run at once. A failing call doesn't
+        cancel the others; its exception is returned in its result slot.
+
+        Example:
+            await db.gather(*(db.log_game(g) for g in games))
+        """
+        return await asyncio.gather(*(self._bounded(c) for c in coros), return_exceptions=True)
+
+    def fire_and_forget(self, coro: Awaitable) -> Optional[asyncio.Task]:
+        """
+        Schedule a logger call without waiting for it.
+
+        For writes whose result the caller doesn't need (status updates,
+        checkpoints). Failures are logged, not raised. Writes share the
+        gather() concurrency limit; past _MAX_BACKGROUND_WRITES outstanding
+        ones, new writes are dropped with a warning.
+
+        Example:
+            db.fire_and_forget(db.update_order_status(order_id, 'filled', count))
+
+        Returns:
+            The scheduled task, or None if the write was dropped
+        """
+        if len(self._background) >= _MAX_BACKGROUND_WRITES:
+            coro.close()
+            logger.warning(f"Dropping database write: {_MAX_BACKGROUND_WRITES} still pending")
+            return None
+
+        task = asyncio.create_task(self._bounded(coro))
+        self._background.add(task)
+        task.add_done_callback(self._on_background_done)
+        return task
+
+    def _on_background_done(self, task: asyncio.Task):
+        """Release a finished fire_and_forget task and log its failure, if any."""
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background database write failed: {task.exception()}")
+
+    async def log_games(self, games_data: list[dict]) -> list[Optional[str]]:
+        """
+        Log several games concurrently.
+
+        Returns:
+            Game IDs in input order (None where logging failed)
+        """
+        results = await self.gather(*(self.log_game(g) for g in games_data))
+        return [r if isinstance(r, str) else None for r in results]
+
+    async def log_game(self, game_data: dict) -> Optional[str]:
+        """
+        Log a new game to the database.
+
+        Args:
+            game_data: Dict with keys: market_ticker, event_ticker, market_title,
+                      yes_subtitle, kickoff_ts, halftime_ts, pregame_prob, status
+
+        Returns:
+            Game ID if successful, None otherwise
+        """
+        if not self.pool:
+            return None
+
+        columns = [c for c in _GAME_COLUMNS if c in game_data]
+        placeholders = ', '.join(f'${i}' for i in range(1, len(columns) + 1))
+        # The no-op update makes RETURNING yield the existing row's id
+        # without overwriting anything an earlier run already recorded
+        query = (
+            f"INSERT INTO games ({', '.join(columns)}) VALUES ({placeholders}) "
+            "ON CONFLICT (market_ticker) DO UPDATE SET market_ticker = EXCLUDED.market_ticker "
+            "RETURNING id"
+        )
+
+        try:
+            async with self.pool.acquire() as conn:
+                game_id = await conn.fetchval(query, *(game_data[c] for c in columns))
+            logger.debug(f"Logged game to Supabase: {game_data['market_ticker']}")
+            return str(game_id)
+        except Exception as e:
+            logger.error(f"Error logging game to Supabase: {e}")
+
+        return None
+
+    async def update_game_status(self, market_ticker: str, status: str, pregame_prob: Optional[float] = None):
+        """Update game status (monitoring, triggered, completed, timeout)."""
+        if not self.pool:
+            return
+
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.execute(_GAME_STATUS_UPDATE, market_ticker, status, pregame_prob)
+            logger.debug(f"Updated game status: {market_ticker} -> {status}")
+        except Exception as e:
+            logger.error(f"Error updating game status: {e}")
+
+    async def update_game_checkpoint(self, market_ticker: str, field_name: str, odds: float, timestamp: int):
+        """
+        Update checkpoint odds for a game.
+
+        Args:
+            market_ticker: Market ticker to identify the game
+            field_name: Name of the checkpoint field ('odds_6h', 'odds_3h', 'odds_30m')
+            odds: The odds value (0-1 probability)
+            timestamp: Unix timestamp when the checkpoint was captured
+        """
+        if not self.pool:
+            return
+
+        # Column names can't be bound as parameters, so only known ones are accepted
+        query = _CHECKPOINT_UPDATES.get(field_name)
+        if query is None:
+            logger.error(f"Unknown checkpoint field: {field_name}")
+            return
+
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.execute(query, market_ticker, odds, timestamp)
+            logger.debug(f"Updated {field_name}: {market_ticker} -> {odds:.0%}")
+        except Exception as e:
+            logger.error(f"Error updating checkpoint {field_name}: {e}")
+
+    async def update_game_checkpoint_and_eligibility(self, market_ticker: str, field_name: str, odds: float,
+                                                     timestamp: int, is_eligible: bool):
+        """
+        Update checkpoint odds and eligibility with a single UPDATE.
+
+        Args:
+            market_ticker: Market ticker to identify the game
+            field_name: Name of the checkpoint field ('odds_6h', 'odds_3h', 'odds_30m')
+            odds: The odds value (0-1 probability)
+            timestamp: Unix timestamp when the checkpoint was captured
+            is_eligible: Whether the game is eligible for trading based on checkpoint rules
+        """
+        if not self.pool:
+            return
+
+        query = _CHECKPOINT_ELIGIBILITY_UPDATES.get(field_name)
+        if query is None:
+            logger.error(f"Unknown checkpoint field: {field_name}")
+            return
+
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.execute(query, market_ticker, odds, timestamp, is_eligible)
+            logger.debug(f"Updated {field_name}: {market_ticker} -> {odds:.0%} (eligible={is_eligible})")
+        except Exception as e:
+            logger.error(f"Error updating checkpoint {field_name}: {e}")
+
+    async def update_game_eligibility(self, market_ticker: str, is_eligible: bool):
+        """
+        Update the eligibility status for a game.
+
+        Args:
+            market_ticker: Market ticker to identify the game
+            is_eligible: Whether the game is eligible for trading based on checkpoint rules
+        """
+        if not self.pool:
+            return
+
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.execute(_GAME_ELIGIBILITY_UPDATE, market_ticker, is_eligible)
+            logger.debug(f"Updated eligibility: {market_ticker} -> {is_eligible}")
+        except Exception as e:
+            logger.error(f"Error updating eligibility: {e}")
+
+    @retry_db_operation()
+    async def log_position_entry(self, position_data: dict) -> Optional[str]:
+        """
+        Log a new position entry.
+
+        Args:
+            position_data: Dict with keys: market_ticker, entry_price, size,
+                          entry_time, order_id, status='open'
+
+        Returns:
+            Position ID if successful, None otherwise
+        """
+        if not self.pool:
+            return None
+
+        # game_id is resolved inside the INSERT; no games row means no insert
+        async with self.pool.acquire() as conn:
+            position_id = await conn.fetchval(
+                "INSERT INTO positions (game_id, market_ticker, order_id, entry_price, size, entry_time, status) "
+                "SELECT id, $1, $2, $3, $4, $5, 'open' FROM games WHERE market_ticker = $1 RETURNING id",
+                position_data['market_ticker'], position_data.get('order_id'),
+                position_data['entry_price'], position_data['size'], position_data['entry_time'],
+            )
+
+        if position_id is None:
+            logger.warning(f"Game not found for position: {position_data['market_ticker']}")
+            return None
+
+        logger.debug(f"Logged position entry: {position_data['size']} @ {position_data['entry_price']}¢")
+        return str(position_id)
+
+    @retry_db_operation()
+    async def log_position_exit(self, position_id: str, exit_price: int, exit_time: int, pnl: float):
+        """
+        Update position with exit details and calculate P&L.
+
+        Args:
+            position_id: ID returned by log_position_entry
+        """
+        if not self.pool:
+            return
+
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                "UPDATE positions SET exit_price = $2, exit_time = $3, pnl = $4, status = 'closed' "
+                "WHERE id = $1",
+                position_id, exit_price, exit_time, pnl,
+            )
+        logger.debug(f"Logged position exit: {position_id} P&L=${pnl:+.2f}")
+
+    @retry_db_operation()
+    async def close_position_atomic(self, order_id: str, position_id: str, exit_price: int, exit_time: int,
+                                    pnl: float, filled_size: int, bankroll_delta: float, new_bankroll: float,
+                                    description: Optional[str] = None):
+        """
+        Record a filled exit in one round-trip.
+
+        Does the work of update_order_status + log_position_exit +
+        log_bankroll_change as a single statement (data-modifying CTEs), so
+        either all three writes land or none do.
+
+        Args:
+            order_id: Kalshi order ID of the filled exit order
+            position_id: ID returned by log_position_entry
+            exit_price: Average exit price in cents
+            exit_time: Unix timestamp of the exit (also used for the bankroll row)
+            pnl: Realized P&L
+            filled_size: Number of contracts filled on the exit order
+            bankroll_delta: Change in bankroll from the exit proceeds
+            new_bankroll: Bankroll after the exit
+            description: Bankroll history description
+        """
+        if not self.pool:
+            return
+
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                "WITH closed_order AS ("
+                "  UPDATE orders SET status = 'filled', filled_size = $2 WHERE order_id = $1"
+                "), closed_positions AS ("
+                "  UPDATE positions SET exit_price = $4, exit_time = $5, pnl = $6, status = 'closed'"
+                "  WHERE id = $3"
+                ") "
+                "INSERT INTO bankroll_history (timestamp, amount, change, game_id, description) "
+                "VALUES ($5, $8, $7, (SELECT game_id FROM positions WHERE id = $3), $9)",
+                order_id, filled_size, position_id, exit_price, exit_time, pnl,
+                bankroll_delta, new_bankroll, description,
+            )
+        logger.debug(f"Logged position exit: {position_id} P&L=${pnl:+.2f} (order {order_id})")
+
+    @retry_db_operation()
+    async def update_position_status(self, order_id: str, status: str, exit_price: Optional[int] = None, pnl: Optional[float] = None):
+        """
+        Update position status in database.
+
+        Args:
+            order_id: The original buy order ID
+            status: New status ('open' or 'closed')
+            exit_price: Exit price in cents (if closing)
+            pnl: Realized P&L (if closing)
+        """
+        if not self.pool:
+            return
+
+        async with self.pool.acquire() as conn:
+            if status == 'closed':
+                await conn.execute(
+                    "UPDATE positions SET status = $2, exit_price = $3, pnl = $4, exit_time = $5 "
+                    "WHERE order_id = $1",
+                    order_id, status, exit_price, pnl, int(time.time()),
+                )
+            else:
+                await conn.execute(
+                    "UPDATE positions SET status = $2 WHERE order_id = $1",
+                    order_id, status,
+                )
+
+        logger.info(f"✓ Updated position status: {order_id} → {status}")
+
+    async def log_bankroll_change(self, timestamp: int, new_amount: float, change: float,
+                                  game_id: Optional[str] = None, description: Optional[str] = None):
+        """Queue a bankroll change for the history table (written in batches)."""
+        if not self.pool:
+            return
+
+        self._bankroll_queue.put_nowait((timestamp, new_amount, change, game_id, description))
+        logger.debug(f"Logged bankroll: ${new_amount:.2f} ({change:+.2f})")
+
+    async def log_price_tick(self, market_ticker: str, timestamp: int, favorite_price: float,
+                             yes_ask: Optional[int] = None, no_ask: Optional[int] = None):
+        """
+        Queue a price tick for historical data collection (written in batches).
+
+        Ticks for games without a games row are kept with a NULL game_id.
+
+        Args:
+            market_ticker: Market ticker to identify the game
+            timestamp: Unix timestamp when price was captured
+            favorite_price: Favorite's probability (0-1)
+            yes_ask: Price to buy YES in cents
+            no_ask: Price to buy NO in cents
+        """
+        if not self.pool:
+            return
+
+        self._tick_queue.put_nowait((market_ticker, timestamp, favorite_price, yes_ask, no_ask))
+        # Only log at debug level to avoid spam (happens every 10 seconds)
+        logger.debug(f"Logged price tick: {market_ticker} @ {favorite_price:.0%}")
+
+    async def bulk_log_price_ticks(self, ticks: list[tuple]) -> int:
+        """
+        Load many price ticks at once over COPY, e.g. for backfills or replays.
+
+        game_ids are resolved with one query for all tickers; ticks for
+        unknown games get a NULL game_id, as with log_price_tick.
+
+        Args:
+            ticks: (market_ticker, timestamp, favorite_price, yes_ask, no_ask) tuples
+
+        Returns:
+            Number of ticks written
+        """
+        if not self.pool or not ticks:
+            return 0
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT market_ticker, id FROM games WHERE market_ticker = ANY($1::text[])",
+                    list({t[0] for t in ticks}),
+                )
+                game_ids = {row['market_ticker']: row['id'] for row in rows}
+
+                await conn.copy_records_to_table(
+                    'market_ticks',
+                    records=[
+                        (market_ticker, game_ids.get(market_ticker), timestamp, favorite_price, yes_ask, no_ask)
+                        for market_ticker, timestamp, favorite_price, yes_ask, no_ask in ticks
+                    ],
+                    columns=['market_ticker', 'game_id', 'timestamp', 'favorite_price', 'yes_ask', 'no_ask'],
+                )
+            logger.info(f"✓ Bulk loaded {len(ticks)} price ticks")
+            return len(ticks)
+
+        except Exception as e:
+            logger.error(f"Error bulk loading price ticks: {e}")
+            return 0
+
+    async def log_order(self, market_ticker: str, order_id: str, price: int, size: int, side: str = 'buy') -> Optional[str]:
+        """
+        Log a new order placement.
+
+        Args:
+            market_ticker: Market ticker to identify the game
+            order_id: Kalshi order ID
+            price: Order price in cents
+            size: Number of contracts
+            side: 'buy' or 'sell'
+
+        Returns:
+            Order record ID if successful, None otherwise
+        """
+        if not self.pool:
+            return None
+
+        try:
+            async with self.pool.acquire() as conn:
+                record_id = await conn.fetchval(
+                    "INSERT INTO orders (game_id, market_ticker, order_id, price, size, filled_size, status, side) "
+                    "SELECT id, $1, $2, $3, $4, 0, 'pending', $5 FROM games WHERE market_ticker = $1 RETURNING id",
+                    market_ticker, order_id, price, size, side,
+                )
+
+            if record_id is None:
+                logger.warning(f"Game not found for order: {market_ticker}")
+                return None
+
+            logger.debug(f"Logged order: {order_id} - {size} @ {price}¢ ({side})")
+            return str(record_id)
+
+        except Exception as e:
+            logger.error(f"Error logging order: {e}")
+
+        return None
+
+    @retry_db_operation()
+    async def update_order_status(self, order_id: str, status: str, filled_size: int = 0):
+        """
+        Update order status (e.g., when order fills or gets cancelled).
+
+        Args:
+            order_id: Kalshi order ID
+            status: 'pending', 'filled', 'partially_filled', 'cancelled'
+            filled_size: Number of contracts filled
+        """
+        if not self.pool:
+            return
+
+        async with self.pool.acquire() as conn:
+            await conn.execute(_ORDER_STATUS_UPDATE, order_id, status, filled_size)
+        logger.debug(f"Updated order {order_id}: {status} ({filled_size} filled)")
+
+    async def get_pending_orders(self, market_ticker: str) -> list:
+        """
+        Get all pending orders for a market.
+
+        Args:
+            market_ticker: Market ticker to identify the game
+
+        Returns:
+            List of pending order records
+        """
+        if not self.pool:
+            return []
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    f"SELECT {_ORDER_COLUMNS} FROM orders WHERE market_ticker = $1 AND status = 'pending'",
+                    market_ticker,
+                )
+            return [dict(row) for row in rows]
+
+        except Exception as e:
+            logger.error(f"Error getting pending orders: {e}")
+            return []
+
+    async def get_order(self, order_id: str) -> Optional[dict]:
+        """
+        Get order details by order_id.
+
+        Args:
+            order_id: Kalshi order ID
+
+        Returns:
+            Order record dict or None
+        """
+        if not self.pool:
+            return None
+
+        try:
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow(f"SELECT {_ORDER_COLUMNS} FROM orders WHERE order_id = $1", order_id)
+            return dict(row) if row else None
+
+        except Exception as e:
+            logger.error(f"Error getting order {order_id}: {e}")
+            return None